@@ -6,31 +6,53 @@ This service provides a REST API interface to the existing coffee scraping scrip
 """
 
 import asyncio
-import json
 import logging
-import subprocess
-import tempfile
+import os
+import sys
 import time
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+import httpx
+import orjson
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, HttpUrl
 import uvicorn
 
-# Configure logging
+from run_product_scraper import iter_products, scrape_batch
+from run_roaster import scrape_single
+
+# Configure logging (force=True: the scraper modules configure logging on import)
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    force=True,
 )
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open one pooled HTTP client for the app's lifetime so scrapes reuse connections."""
+    app.state.http = httpx.AsyncClient(
+        timeout=HTTP_TIMEOUT,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0),
+    )
+    try:
+        yield
+    finally:
+        await app.state.http.aclose()
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Coffee Scraping API",
     description="API for scraping coffee roaster and product data",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -55,6 +77,9 @@ class ScrapeResponse(BaseModel):
     total_products: int = 0
     errors: List[str] = []
 
+class ProductStreamRequest(BaseModel):
+    website_url: str
+
 class HealthResponse(BaseModel):
     status: str
     timestamp: float
@@ -63,11 +88,48 @@ class HealthResponse(BaseModel):
 # Configuration
 ROASTER_TIMEOUT = 120  # seconds
 PRODUCTS_TIMEOUT = 300  # seconds
+MAX_CONCURRENT_SCRAPES = 4  # each scrape drives a headless browser
+HTTP_TIMEOUT = 30.0  # seconds, per request on the shared client
+SCRAPE_CACHE_TTL = 3600  # seconds
+SCRAPE_CACHE_MAXSIZE = 1024
+VALID_OPTIONS = frozenset({"roaster", "products"})
 SCRIPT_DIR = Path(__file__).parent
+# Run each scrape in a child process (isolates browser crashes/leaks) instead of in-process
+SCRAPE_IN_SUBPROCESS = os.getenv("SCRAPE_IN_SUBPROCESS", "").lower() in ("1", "true", "yes")
+
+# Caps concurrent scrapes; queued requests wait here, outside their timeout
+_scrape_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+
+# Successful responses keyed by (name, website_url, frozenset(options)) -> (expires_at, response)
+_scrape_cache: Dict[tuple, tuple[float, ScrapeResponse]] = {}
+# One task per in-flight key so identical concurrent requests share a single scrape
+_scrape_inflight: Dict[tuple, asyncio.Task] = {}
+# Marks the end of a product stream's queue
+_STREAM_DONE = object()
 
-def run_subprocess_with_timeout(cmd: List[str], timeout: int, description: str) -> tuple[bool, str, str]:
+def get_cached_response(key: tuple) -> Optional[ScrapeResponse]:
+    """Return the cached response for key, or None if missing or expired."""
+    entry = _scrape_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, response = entry
+    if expires_at < time.monotonic():
+        del _scrape_cache[key]
+        return None
+    return response
+
+def cache_response(key: tuple, response: ScrapeResponse) -> None:
+    """Store a response for SCRAPE_CACHE_TTL seconds, evicting the oldest entry when full."""
+    if key not in _scrape_cache and len(_scrape_cache) >= SCRAPE_CACHE_MAXSIZE:
+        del _scrape_cache[next(iter(_scrape_cache))]
+    _scrape_cache[key] = (time.monotonic() + SCRAPE_CACHE_TTL, response)
+
+async def run_subprocess_async(cmd: List[str], timeout: int, description: str) -> tuple[bool, str, str]:
     """
-    Run a subprocess with timeout and return success status, stdout, and stderr.
+    Run a subprocess without blocking the event loop and return success status, stdout, and stderr.
+    
+    The child is killed if it times out or the caller is cancelled; a timeout is
+    re-raised as asyncio.TimeoutError so callers can report it as such.
     
     Args:
         cmd: Command to run
@@ -76,222 +138,247 @@ def run_subprocess_with_timeout(cmd: List[str], timeout: int, description: str)
         
     Returns:
         Tuple of (success, stdout, stderr)
+        
+    Raises:
+        asyncio.TimeoutError: If the child does not finish within timeout
     """
+    proc = None
     try:
         logger.info(f"Running {description}: {' '.join(cmd)}")
         start_time = time.time()
         
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
             cwd=SCRIPT_DIR
         )
+        stdout_bytes, stderr_bytes = await asyncio.wait_for(proc.communicate(), timeout)
+        stdout = stdout_bytes.decode("utf-8", errors="replace")
+        stderr = stderr_bytes.decode("utf-8", errors="replace")
         
         elapsed = time.time() - start_time
-        logger.info(f"{description} completed in {elapsed:.2f}s with return code {result.returncode}")
+        logger.info(f"{description} completed in {elapsed:.2f}s with return code {proc.returncode}")
         
-        if result.returncode == 0:
-            return True, result.stdout, result.stderr
+        if proc.returncode == 0:
+            return True, stdout, stderr
         else:
-            logger.error(f"{description} failed with return code {result.returncode}")
-            logger.error(f"STDOUT: {result.stdout}")
-            logger.error(f"STDERR: {result.stderr}")
-            return False, result.stdout, result.stderr
+            logger.error(f"{description} failed with return code {proc.returncode}")
+            logger.error(f"STDOUT: {stdout}")
+            logger.error(f"STDERR: {stderr}")
+            return False, stdout, stderr
             
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         logger.error(f"{description} timed out after {timeout}s")
-        return False, "", f"Timeout after {timeout} seconds"
+        raise
     except Exception as e:
         logger.error(f"Error running {description}: {e}")
         return False, "", str(e)
+    finally:
+        if proc is not None and proc.returncode is None:
+            proc.kill()
+            await proc.wait()
 
-def read_json_file(file_path: Path) -> Optional[Dict]:
-    """Read and parse a JSON file, returning None if file doesn't exist or is invalid."""
-    try:
-        if not file_path.exists():
-            logger.warning(f"File not found: {file_path}")
-            return None
+async def run_scraper_json(cmd: List[str], timeout: int, description: str):
+    """
+    Run a scraper CLI in --stdout-json mode and parse the JSON it prints.
+    
+    Args:
+        cmd: Command to run (must include --stdout-json)
+        timeout: Timeout in seconds
+        description: Description for logging
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        logger.info(f"Successfully read JSON file: {file_path}")
-        return data
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in {file_path}: {e}")
-        return None
-    except Exception as e:
-        logger.error(f"Error reading {file_path}: {e}")
-        return None
+    Returns:
+        The decoded JSON payload
+    """
+    success, stdout, stderr = await run_subprocess_async(cmd, timeout, description)
+    if not success:
+        lines = stderr.strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"{description} exited with an error")
+    try:
+        return orjson.loads(stdout)
+    except orjson.JSONDecodeError as e:
+        raise RuntimeError(f"{description} printed invalid JSON: {e}") from e
 
-async def scrape_roaster(name: str, website_url: str) -> tuple[bool, Optional[Dict], List[str]]:
+async def scrape_roaster(
+    name: str, website_url: str, http_client: Optional[httpx.AsyncClient] = None
+) -> tuple[bool, Optional[Dict], List[str]]:
     """
-    Scrape roaster data using the existing roaster scraper script.
+    Scrape roaster data by calling the roaster scraper in-process.
     
     Args:
         name: Roaster name
         website_url: Roaster website URL
+        http_client: Shared HTTP client to reuse for downstream requests
         
     Returns:
         Tuple of (success, roaster_data, errors)
     """
     errors = []
     
-    # Create temporary output file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-        temp_output = Path(temp_file.name)
-    
     try:
-        # Run roaster scraper
-        cmd = [
-            "python", "run_roaster.py",
-            "--single",
-            "--input", f"{name},{website_url}",
-            "--output", str(temp_output)
-        ]
-        
-        success, stdout, stderr = run_subprocess_with_timeout(
-            cmd, ROASTER_TIMEOUT, "roaster scraper"
-        )
+        async with _scrape_semaphore:
+            logger.info(f"Running roaster scraper for {name} ({website_url})")
+            start_time = time.time()
+            
+            if SCRAPE_IN_SUBPROCESS:
+                cmd = [sys.executable, "run_roaster.py", "--single", "--stdout-json"]
+                cmd += ["--input", f"{name},{website_url}"]
+                # run_subprocess_async applies the timeout itself and raises asyncio.TimeoutError
+                roaster_data = await run_scraper_json(cmd, ROASTER_TIMEOUT, "roaster scraper")
+            else:
+                scrape = scrape_single(name, website_url, http_client=http_client)
+                roaster_data = await asyncio.wait_for(scrape, timeout=ROASTER_TIMEOUT)
         
-        if not success:
-            errors.append(f"Roaster scraping failed: {stderr}")
-            return False, None, errors
+        elapsed = time.time() - start_time
+        logger.info(f"roaster scraper completed in {elapsed:.2f}s")
         
-        # Read the output file
-        roaster_data = read_json_file(temp_output)
-        if roaster_data is None:
-            errors.append("Failed to read roaster output file")
+        if not roaster_data:
+            errors.append("Roaster scraper returned no data")
             return False, None, errors
         
-        # The script saves as a list, so take the first item
-        if isinstance(roaster_data, list) and len(roaster_data) > 0:
-            roaster_data = roaster_data[0]
-        
         logger.info(f"Successfully scraped roaster: {name}")
         return True, roaster_data, errors
         
+    except asyncio.TimeoutError:
+        logger.error(f"roaster scraper timed out after {ROASTER_TIMEOUT}s")
+        errors.append(f"Roaster scraping failed: Timeout after {ROASTER_TIMEOUT} seconds")
+        return False, None, errors
     except Exception as e:
         errors.append(f"Unexpected error in roaster scraping: {e}")
         logger.error(f"Error scraping roaster {name}: {e}")
         return False, None, errors
-    finally:
-        # Clean up temporary file
-        try:
-            temp_output.unlink(missing_ok=True)
-        except Exception as e:
-            logger.warning(f"Failed to clean up temporary file {temp_output}: {e}")
 
-async def scrape_products(website_url: str) -> tuple[bool, List[Dict], List[str]]:
+async def scrape_products(
+    website_url: str, http_client: Optional[httpx.AsyncClient] = None
+) -> tuple[bool, List[Dict], List[str]]:
     """
-    Scrape products data using the existing product scraper script.
+    Scrape products data by calling the product scraper in-process.
     
     Args:
         website_url: Roaster website URL
+        http_client: Shared HTTP client to reuse for downstream requests
         
     Returns:
         Tuple of (success, products_data, errors)
     """
     errors = []
     
-    # Create temporary output file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-        temp_output = Path(temp_file.name)
-    
     try:
-        # Run product scraper
-        cmd = [
-            "python", "run_product_scraper.py",
-            "batch",
-            "--roaster-link", website_url,
-            "--output", str(temp_output)
-        ]
-        
-        success, stdout, stderr = run_subprocess_with_timeout(
-            cmd, PRODUCTS_TIMEOUT, "product scraper"
-        )
-        
-        if not success:
-            errors.append(f"Product scraping failed: {stderr}")
-            return False, [], errors
-        
-        # Read the output file
-        products_data = read_json_file(temp_output)
-        if products_data is None:
-            errors.append("Failed to read products output file")
-            return False, [], errors
+        async with _scrape_semaphore:
+            logger.info(f"Running product scraper for {website_url}")
+            start_time = time.time()
+            
+            if SCRAPE_IN_SUBPROCESS:
+                cmd = [sys.executable, "run_product_scraper.py", "batch", "--stdout-json"]
+                cmd += ["--roaster-link", website_url]
+                # run_subprocess_async applies the timeout itself and raises asyncio.TimeoutError
+                products_data = await run_scraper_json(cmd, PRODUCTS_TIMEOUT, "product scraper")
+            else:
+                scrape = scrape_batch(website_url, http_client=http_client)
+                products_data = await asyncio.wait_for(scrape, timeout=PRODUCTS_TIMEOUT)
         
-        # Ensure it's a list
-        if not isinstance(products_data, list):
-            products_data = [products_data]
+        elapsed = time.time() - start_time
+        logger.info(f"product scraper completed in {elapsed:.2f}s")
         
         logger.info(f"Successfully scraped {len(products_data)} products from {website_url}")
         return True, products_data, errors
         
+    except asyncio.TimeoutError:
+        logger.error(f"product scraper timed out after {PRODUCTS_TIMEOUT}s")
+        errors.append(f"Product scraping failed: Timeout after {PRODUCTS_TIMEOUT} seconds")
+        return False, [], errors
     except Exception as e:
         errors.append(f"Unexpected error in product scraping: {e}")
         logger.error(f"Error scraping products from {website_url}: {e}")
         return False, [], errors
-    finally:
-        # Clean up temporary file
+
+async def stream_products(website_url: str, http_client: httpx.AsyncClient) -> AsyncIterator[bytes]:
+    """
+    Scrape products in-process and yield each one as an NDJSON line as soon as it is ready.
+    
+    Errors can't change the status code once streaming has started, so a failure or timeout
+    is reported as a final {"error": ...} line instead.
+    
+    Args:
+        website_url: Roaster website URL
+        http_client: Shared HTTP client to reuse for downstream requests
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    count = 0
+    start_time = time.time()
+    
+    async def produce() -> None:
+        # Runs apart from the response so the scrape slot and timeout never wait on a slow client;
+        # the queue is unbounded, so putting a line never blocks
+        nonlocal count
         try:
-            temp_output.unlink(missing_ok=True)
+            async with _scrape_semaphore:
+                logger.info(f"Streaming products for {website_url}")
+                async with asyncio.timeout(PRODUCTS_TIMEOUT):
+                    async for product in iter_products(website_url, http_client=http_client):
+                        count += 1
+                        queue.put_nowait(orjson.dumps(product) + b"\n")
+        except TimeoutError:
+            logger.error(f"product stream timed out after {PRODUCTS_TIMEOUT}s")
+            error = f"Product scraping failed: Timeout after {PRODUCTS_TIMEOUT} seconds"
+            queue.put_nowait(orjson.dumps({"error": error}) + b"\n")
         except Exception as e:
-            logger.warning(f"Failed to clean up temporary file {temp_output}: {e}")
-
-@app.get("/health", response_model=HealthResponse)
-async def health_check():
-    """Health check endpoint."""
-    return HealthResponse(
-        status="healthy",
-        timestamp=time.time()
-    )
+            logger.error(f"Error streaming products from {website_url}: {e}")
+            queue.put_nowait(orjson.dumps({"error": f"Unexpected error in product scraping: {e}"}) + b"\n")
+        finally:
+            queue.put_nowait(_STREAM_DONE)
+    
+    producer = asyncio.create_task(produce())
+    try:
+        while (line := await queue.get()) is not _STREAM_DONE:
+            yield line
+    finally:
+        # Stops the scrape if the client disconnected; a no-op once it has finished
+        producer.cancel()
+    
+    elapsed = time.time() - start_time
+    logger.info(f"Streamed {count} products from {website_url} in {elapsed:.2f}s")
 
-@app.post("/api/scrape", response_model=ScrapeResponse)
-async def scrape_endpoint(request: ScrapeRequest):
+async def run_scrape(
+    request: ScrapeRequest, options: frozenset, http_client: httpx.AsyncClient
+) -> ScrapeResponse:
     """
-    Main scraping endpoint that can scrape roaster data, products, or both.
+    Run the requested scrapers for an already-validated request.
     
     Args:
-        request: ScrapeRequest containing name, website_url, and options
+        request: ScrapeRequest containing name and website_url
+        options: Validated, non-empty subset of VALID_OPTIONS
+        http_client: Shared HTTP client to reuse for downstream requests
         
     Returns:
         ScrapeResponse with scraped data and any errors
     """
-    logger.info(f"Received scrape request for {request.name} ({request.website_url}) with options: {request.options}")
-    
     response = ScrapeResponse(success=False, errors=[])
+    want_roaster = "roaster" in options
+    want_products = "products" in options
     
-    # Validate options
-    valid_options = {"roaster", "products"}
-    invalid_options = set(request.options) - valid_options
-    if invalid_options:
-        response.errors.append(f"Invalid options: {invalid_options}. Valid options are: {valid_options}")
-        return response
-    
-    if not request.options:
-        response.errors.append("At least one option must be specified: 'roaster' or 'products'")
-        return response
-    
-    # Scrape roaster data if requested
-    if "roaster" in request.options:
+    # Roaster and product scrapes are independent, so run them concurrently
+    scrapes = []
+    if want_roaster:
         logger.info(f"Scraping roaster data for {request.name}")
-        roaster_success, roaster_data, roaster_errors = await scrape_roaster(
-            request.name, request.website_url
-        )
+        scrapes.append(scrape_roaster(request.name, request.website_url, http_client=http_client))
+    if want_products:
+        logger.info(f"Scraping products data for {request.website_url}")
+        scrapes.append(scrape_products(request.website_url, http_client=http_client))
+    # Both helpers catch their own errors, so results come back in the order appended
+    results = await asyncio.gather(*scrapes)
+    
+    if want_roaster:
+        roaster_success, roaster_data, roaster_errors = results.pop(0)
         response.roaster_data = roaster_data
         response.errors.extend(roaster_errors)
         
         if not roaster_success:
             logger.warning(f"Roaster scraping failed for {request.name}")
     
-    # Scrape products data if requested
-    if "products" in request.options:
-        logger.info(f"Scraping products data for {request.website_url}")
-        products_success, products_data, products_errors = await scrape_products(
-            request.website_url
-        )
+    if want_products:
+        products_success, products_data, products_errors = results.pop(0)
         response.products_data = products_data
         response.total_products = len(products_data)
         response.errors.extend(products_errors)
@@ -299,22 +386,110 @@ async def scrape_endpoint(request: ScrapeRequest):
         if not products_success:
             logger.warning(f"Product scraping failed for {request.website_url}")
     
-    # Determine overall success
-    if "roaster" in request.options and "products" in request.options:
-        # Both requested - need both to succeed
-        roaster_success = response.roaster_data is not None
-        products_success = len(response.products_data) > 0 or not response.errors
-        response.success = roaster_success and products_success
-    elif "roaster" in request.options:
-        # Only roaster requested
-        response.success = response.roaster_data is not None
-    else:
-        # Only products requested
-        response.success = len(response.products_data) > 0 or not response.errors
+    # Every requested part must succeed; products count as scraped if any came back or nothing errored
+    response.success = (not want_roaster or response.roaster_data is not None) and (
+        not want_products or len(response.products_data) > 0 or not response.errors
+    )
     
     logger.info(f"Scrape request completed for {request.name}. Success: {response.success}")
     return response
 
+async def handle_scrape(request: ScrapeRequest, http_client: httpx.AsyncClient) -> ScrapeResponse:
+    """
+    Validate a scrape request and answer it from the cache or by running the scrapers.
+    
+    Args:
+        request: ScrapeRequest containing name, website_url, and options
+        http_client: Shared HTTP client to reuse for downstream requests
+        
+    Returns:
+        ScrapeResponse with scraped data and any errors
+    """
+    logger.info(f"Received scrape request for {request.name} ({request.website_url}) with options: {request.options}")
+    
+    response = ScrapeResponse(success=False, errors=[])
+    
+    # Validate options
+    options = frozenset(request.options)
+    invalid_options = options - VALID_OPTIONS
+    if invalid_options:
+        response.errors.append(
+            f"Invalid options: {set(invalid_options)}. Valid options are: {set(VALID_OPTIONS)}"
+        )
+        return response
+    
+    if not options:
+        response.errors.append("At least one option must be specified: 'roaster' or 'products'")
+        return response
+    
+    key = (request.name, request.website_url, options)
+    cached = get_cached_response(key)
+    if cached is not None:
+        logger.info(f"Returning cached scrape result for {request.name}")
+        return cached
+    
+    task = _scrape_inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(run_scrape(request, options, http_client))
+        _scrape_inflight[key] = task
+        
+        def finish_scrape(done: asyncio.Task) -> None:
+            # Runs once, when the scrape ends, so the entry lives exactly as long as the scrape
+            _scrape_inflight.pop(key, None)
+            if not done.cancelled() and done.exception() is None and done.result().success:
+                cache_response(key, done.result())
+        
+        task.add_done_callback(finish_scrape)
+    else:
+        logger.info(f"Joining in-flight scrape for {request.name}")
+    
+    # Shield so one client disconnecting does not cancel the scrape for the others
+    return await asyncio.shield(task)
+
+@app.get("/health", response_model=HealthResponse)
+async def health_check():
+    """Health check endpoint."""
+    return HealthResponse(
+        status="healthy",
+        timestamp=time.time()
+    )
+
+@app.post("/api/scrape", response_model=ScrapeResponse, response_class=ORJSONResponse)
+async def scrape_endpoint(request: ScrapeRequest, http_request: Request):
+    """
+    Main scraping endpoint that can scrape roaster data, products, or both.
+    
+    Returns an already-serialized ORJSONResponse, so FastAPI skips re-validating the
+    ScrapeResponse it was built from; response_model is kept for the OpenAPI schema.
+    
+    Args:
+        request: ScrapeRequest containing name, website_url, and options
+        http_request: Incoming request, used to reach the app's shared HTTP client
+        
+    Returns:
+        ScrapeResponse with scraped data and any errors
+    """
+    response = await handle_scrape(request, http_request.app.state.http)
+    return ORJSONResponse(response.model_dump())
+
+@app.post("/api/scrape/stream")
+async def scrape_stream_endpoint(request: ProductStreamRequest, http_request: Request):
+    """
+    Stream products for a roaster website as NDJSON (one JSON object per line).
+    
+    Unlike /api/scrape, clients can start consuming products before the scrape finishes.
+    Streaming always runs in-process and bypasses the response cache.
+    
+    Args:
+        request: ProductStreamRequest containing website_url
+        http_request: Incoming request, used to reach the app's shared HTTP client
+    """
+    logger.info(f"Received product stream request for {request.website_url}")
+    return StreamingResponse(
+        stream_products(request.website_url, http_request.app.state.http),
+        media_type="application/x-ndjson",
+    )
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler for unhandled errors."""
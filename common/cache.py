@@ -10,86 +10,269 @@ Cache invalidation respects field stability categories as defined in the PRD:
 Note: File-based cache is not fully thread/process safe for concurrent writes. For high concurrency, use file locks or a dedicated cache backend.
 """
 
+import functools
 import hashlib
-import json
+import os
 import re
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
+import orjson
+import zstandard as zstd
 from loguru import logger
 from pydantic import AnyUrl, HttpUrl
 
 from config import CACHE_DIR
 from db.models import Coffee
 
+# Bump when the on-disk layout or key scheme changes so stale entries are refetched once
+CACHE_VERSION = 4
+
+_NS_PER_DAY = 86_400_000_000_000
+
+# Parsed entries kept in memory per ScraperCache, revalidated against the file's mtime
+MEMORY_CACHE_MAXSIZE = 512
+
+# Sentinel for a memory-cache miss, since cached payloads may be empty or falsy
+_MISSING = object()
+
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+_URL_SCHEME = re.compile(rb"^https?://(?:www\.)?")
+_URL_TAIL = re.compile(rb"/+$")
+
+
+# Exact-type fast path for _json_default; subclasses fall through to the isinstance checks
+_JSON_CONVERTERS: Dict[type, Callable[[Any], Any]] = {HttpUrl: str, AnyUrl: str, set: list, frozenset: list}
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize the values orjson doesn't handle natively."""
+    convert = _JSON_CONVERTERS.get(type(obj))
+    if convert is not None:
+        return convert(obj)
+    if isinstance(obj, (HttpUrl, AnyUrl)):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _read_bytes_fast(path: Path) -> bytes:
+    """Read a whole file with one sized os.read, skipping the buffered file object."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=65536)
+def _cache_key_for_url(url: str) -> str:
+    """Normalize a URL and hash it into a cache key."""
+    b = url.strip().lower().encode()
+    b = _URL_SCHEME.sub(b"", b, count=1)
+    b = _URL_TAIL.sub(b"", b, count=1)  # Remove trailing slashes
+
+    return hashlib.blake2b(b, digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=65536)
+def _cache_key_for_roaster(name: str, url: str) -> str:
+    """Hash a roaster's name and URL into a cache key."""
+    return hashlib.blake2b(name.encode() + b"\x00" + url.encode(), digest_size=16).hexdigest()
+
 
 class ScraperCache:
     """Cache manager for scraper data."""
 
+    # Cache directories already created in this process, so repeat instances skip the mkdir calls.
+    # They may have been deleted since, so scans and clears treat a missing directory as empty.
+    _initialized: Set[Path] = set()
+
     def __init__(self, cache_dir=None):
         """Initialize the cache manager."""
         self.cache_dir = Path(cache_dir or CACHE_DIR)
-        self.roaster_cache_dir = self.cache_dir / "roasters"
-        self.product_cache_dir = self.cache_dir / "products"
-        self.page_cache_dir = self.cache_dir / "pages"
+        versioned_dir = self.cache_dir / f"v{CACHE_VERSION}"
+        self.roaster_cache_dir = versioned_dir / "roasters"
+        self.product_cache_dir = versioned_dir / "products"
+        self.page_cache_dir = versioned_dir / "pages"
 
         # Create cache directories
-        self.roaster_cache_dir.mkdir(exist_ok=True, parents=True)
-        self.product_cache_dir.mkdir(exist_ok=True, parents=True)
-        self.page_cache_dir.mkdir(exist_ok=True, parents=True)
+        for d in (self.roaster_cache_dir, self.product_cache_dir, self.page_cache_dir):
+            if d not in ScraperCache._initialized:
+                d.mkdir(exist_ok=True, parents=True)
+                ScraperCache._initialized.add(d)
+
+        # HTML pages are stored zstd-compressed
+        self._zc = zstd.ZstdCompressor(level=3)
+        self._zd = zstd.ZstdDecompressor()
+
+        # cache file -> (st_mtime_ns, parsed payload), oldest first
+        self._mem: "OrderedDict[Path, Tuple[int, Any]]" = OrderedDict()
+        self._mem_max = MEMORY_CACHE_MAXSIZE
+
+        # cache key -> st_mtime_ns for each directory, scanned once so lookups don't stat per file.
+        # Files written by other processes after this scan are not seen by this instance.
+        # Pages and roasters are sharded by key prefix; products are keyed by roaster ID and stay flat.
+        self._page_mtimes = self._scan_mtimes(self.page_cache_dir, ".html.zst", sharded=True)
+        self._roaster_mtimes = self._scan_mtimes(self.roaster_cache_dir, ".json", sharded=True)
+        self._product_mtimes = self._scan_mtimes(self.product_cache_dir, ".json")
+
+    @staticmethod
+    def _shard(key: str, base: Path, ext: str) -> Path:
+        """Path of a cache file under a subdirectory named after the first two characters of its key."""
+        return base / key[:2] / f"{key}{ext}"
+
+    @staticmethod
+    def _scan_mtimes(cache_dir: Path, suffix: str, sharded: bool = False) -> Dict[str, int]:
+        """
+        Map each cache file's key (its name without suffix) to its mtime in nanoseconds.
+        With sharded=True, scans the shard subdirectories instead of the directory itself.
+        A missing directory scans as empty; writes recreate it.
+        """
+        mtimes = {}
+        dirs = [cache_dir]
+        while dirs:
+            current = dirs.pop()
+            try:
+                it = os.scandir(current)
+            except FileNotFoundError:
+                continue
+            with it:
+                for entry in it:
+                    if entry.is_dir():
+                        if sharded and current == cache_dir:
+                            dirs.append(Path(entry.path))
+                    elif entry.name.endswith(suffix) and not (sharded and current == cache_dir):
+                        mtimes[entry.name[: -len(suffix)]] = entry.stat().st_mtime_ns
+        return mtimes
+
+    def _recall(self, cache_file: Path, mtime_ns: int) -> Any:
+        """
+        Return the in-memory payload for a cache file if it matches mtime_ns, else _MISSING.
+        The same object is handed to every caller, so payloads must be treated as read-only.
+        """
+        entry = self._mem.get(cache_file)
+        if entry is None or entry[0] != mtime_ns:
+            return _MISSING
+        self._mem.move_to_end(cache_file)
+        return entry[1]
+
+    def _remember(self, cache_file: Path, mtime_ns: int, payload: Any) -> Any:
+        """Store a parsed payload in memory, evicting the least recently used entry when full."""
+        self._mem[cache_file] = (mtime_ns, payload)
+        self._mem.move_to_end(cache_file)
+        if len(self._mem) > self._mem_max:
+            self._mem.popitem(last=False)
+        return payload
+
+    def _forget_dir(self, cache_dir: Path) -> None:
+        """Drop in-memory entries for every file in a cache directory."""
+        for cache_file in [f for f in self._mem if cache_dir in f.parents]:
+            del self._mem[cache_file]
+
+    @staticmethod
+    def _atomic_write_bytes(path: Path, data: bytes) -> None:
+        """Write data to a temp file next to path, then rename it over path so readers never see a partial file."""
+        tmp = path.with_suffix(path.suffix + f".{os.getpid()}.tmp")
+        try:
+            f = open(tmp, "wb")
+        except FileNotFoundError:
+            # First file in a new shard directory
+            path.parent.mkdir(parents=True, exist_ok=True)
+            f = open(tmp, "wb")
+        try:
+            with f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+            raise
 
     def _get_cache_key(self, url: str) -> str:
         """Generate a unique cache key for a URL."""
-        # Normalize URL for consistent hashing
-        url = url.lower().strip()
-        url = re.sub(r"https?://(www\.)?", "", url)
-        url = re.sub(r"/+$", "", url)  # Remove trailing slashes
-
-        return hashlib.md5(url.encode()).hexdigest()
+        return _cache_key_for_url(url)
 
     def _get_roaster_cache_key(self, name: str, url: str) -> str:
         """Generate a unique cache key for a roaster."""
-        return hashlib.md5(f"{name}_{url}".encode()).hexdigest()
-
-    def get_cached_html(self, url: str, max_age_days: int = 7, field_stability: Optional[str] = None) -> Optional[str]:
+        return _cache_key_for_roaster(str(name), str(url))
+
+    def _fetch(
+        self,
+        cache_file: Path,
+        mtimes: Dict[str, int],
+        cache_key: str,
+        parser: Callable[[bytes], Any],
+        max_age_days: int,
+        field_stability: Optional[str],
+        label: str,
+    ) -> Any:
         """
-        Get cached HTML for a URL if it exists and is fresh.
-        Optionally, adjust cache TTL based on field stability category (stable, semi-stable, volatile).
+        Read and parse a cache file if it is indexed in mtimes and fresh, going through the in-memory cache.
+        Shared by all get_cached_* methods; label names the entry in log messages.
         """
-        cache_key = self._get_cache_key(url)
-        cache_file = self.page_cache_dir / f"{cache_key}.html"
-
-        if not cache_file.exists():
+        mtime_ns = mtimes.get(cache_key)
+        if mtime_ns is None:
             return None
 
         # Adjust TTL based on field stability
         if field_stability:
             max_age_days = self._ttl_for_stability(field_stability, max_age_days)
         # Check if cache is older than specified age
-        file_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-        if file_age > timedelta(days=max_age_days):
-            logger.debug(f"Cache for {url} is {file_age.days} days old, exceeding max age of {max_age_days} days")
+        age_ns = time.time_ns() - mtime_ns
+        if age_ns > max_age_days * _NS_PER_DAY:
+            logger.debug(
+                f"Cache for {label} is {age_ns // _NS_PER_DAY} days old, exceeding max age of {max_age_days} days"
+            )
             return None
 
+        cached = self._recall(cache_file, mtime_ns)
+        if cached is not _MISSING:
+            return cached
+
         try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                return f.read()
+            return self._remember(cache_file, mtime_ns, parser(_read_bytes_fast(cache_file)))
         except Exception as e:
-            logger.warning(f"Error reading HTML cache for {url}: {e}")
+            mtimes.pop(cache_key, None)
+            logger.warning(f"Error reading cache for {label}: {e}")
             return None
 
+    def _decode_page(self, raw: bytes) -> str:
+        """Decompress and decode a cached HTML page."""
+        return self._zd.decompress(raw).decode("utf-8")
+
+    def get_cached_html(self, url: str, max_age_days: int = 7, field_stability: Optional[str] = None) -> Optional[str]:
+        """
+        Get cached HTML for a URL if it exists and is fresh.
+        Optionally, adjust cache TTL based on field stability category (stable, semi-stable, volatile).
+        """
+        cache_key = self._get_cache_key(url)
+        cache_file = self._shard(cache_key, self.page_cache_dir, ".html.zst")
+
+        return self._fetch(
+            cache_file, self._page_mtimes, cache_key, self._decode_page, max_age_days, field_stability, url
+        )
+
     def cache_html(self, url: str, html_content: str) -> bool:
         """Cache HTML content for a URL."""
         if not html_content:
             return False
 
         cache_key = self._get_cache_key(url)
-        cache_file = self.page_cache_dir / f"{cache_key}.html"
+        cache_file = self._shard(cache_key, self.page_cache_dir, ".html.zst")
+        self._mem.pop(cache_file, None)
 
         try:
-            with open(cache_file, "w", encoding="utf-8") as f:
-                f.write(html_content)
+            self._atomic_write_bytes(cache_file, self._zc.compress(html_content.encode("utf-8")))
+            self._page_mtimes[cache_key] = time.time_ns()
             return True
         except Exception as e:
             logger.warning(f"Error writing HTML cache for {url}: {e}")
@@ -101,28 +284,14 @@ class ScraperCache:
         """
         Get cached roaster if it exists and is fresh.
         Optionally, adjust cache TTL based on field stability category.
+        The returned dict is shared with the in-memory cache and must not be mutated; copy it first.
         """
         cache_key = self._get_roaster_cache_key(name, url)
-        cache_file = self.roaster_cache_dir / f"{cache_key}.json"
-
-        if not cache_file.exists():
-            return None
+        cache_file = self._shard(cache_key, self.roaster_cache_dir, ".json")
 
-        # Adjust TTL based on field stability
-        if field_stability:
-            max_age_days = self._ttl_for_stability(field_stability, max_age_days)
-        # Check if cache is older than specified age
-        file_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-        if file_age > timedelta(days=max_age_days):
-            logger.debug(f"Cache for roaster {name} is {file_age.days} old, exceeding max age of {max_age_days} days")
-            return None
-
-        try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            logger.warning(f"Error reading roaster cache for {name}: {e}")
-            return None
+        return self._fetch(
+            cache_file, self._roaster_mtimes, cache_key, orjson.loads, max_age_days, field_stability, f"roaster {name}"
+        )
 
     def cache_roaster(self, roaster: Dict[str, Any]) -> bool:
         """Cache roaster data."""
@@ -130,11 +299,12 @@ class ScraperCache:
             return False
 
         cache_key = self._get_roaster_cache_key(roaster["name"], roaster["website_url"])
-        cache_file = self.roaster_cache_dir / f"{cache_key}.json"
+        cache_file = self._shard(cache_key, self.roaster_cache_dir, ".json")
+        self._mem.pop(cache_file, None)
 
         try:
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(roaster, f, indent=2)
+            self._atomic_write_bytes(cache_file, orjson.dumps(roaster, option=_JSON_OPTIONS))
+            self._roaster_mtimes[cache_key] = time.time_ns()
             return True
         except Exception as e:
             logger.warning(f"Error writing roaster cache for {roaster['name']}: {e}")
@@ -146,53 +316,20 @@ class ScraperCache:
         """
         Get cached products for a roaster if they exist and are fresh.
         Optionally, adjust cache TTL based on field stability category.
+        The returned list and its dicts are shared with the in-memory cache and must not be mutated;
+        copy them first.
         """
         cache_file = self.product_cache_dir / f"{roaster_id}.json"
 
-        if not cache_file.exists():
-            return None
-
-        # Adjust TTL based on field stability
-        if field_stability:
-            max_age_days = self._ttl_for_stability(field_stability, max_age_days)
-        # Check if cache is older than specified age
-        file_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-        if file_age > timedelta(days=max_age_days):
-            logger.debug(
-                f"Cache for roaster products {roaster_id} is {file_age.days} days old, exceeding max age of {max_age_days} days"
-            )
-            return None
-
-        try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            logger.warning(f"Error reading products cache for roaster {roaster_id}: {e}")
-            return None
-
-    def _convert_to_serializable(self, obj):
-        """Recursively convert objects to serializable types."""
-        if obj is None or isinstance(obj, (str, int, float, bool)):
-            return obj
-        elif isinstance(obj, (HttpUrl, AnyUrl)) or hasattr(obj, "url"):
-            return str(obj)
-        elif isinstance(obj, dict):
-            return {k: self._convert_to_serializable(v) for k, v in obj.items()}
-        elif isinstance(obj, (list, tuple, set)):
-            return [self._convert_to_serializable(item) for item in obj]
-        elif hasattr(obj, "model_dump"):  # Pydantic v2
-            return self._convert_to_serializable(obj.model_dump())
-        elif hasattr(obj, "dict"):  # Pydantic v1
-            return self._convert_to_serializable(obj.dict())
-        elif hasattr(obj, "__dict__"):  # Other objects with __dict__
-            return self._convert_to_serializable(obj.__dict__)
-        else:
-            # Try to convert to string as a last resort
-            try:
-                return str(obj)
-            except Exception:
-                logger.warning(f"Could not serialize object of type {type(obj)}: {obj}")
-                return None
+        return self._fetch(
+            cache_file,
+            self._product_mtimes,
+            roaster_id,
+            orjson.loads,
+            max_age_days,
+            field_stability,
+            f"roaster products {roaster_id}",
+        )
 
     def _ttl_for_stability(self, field_stability: str, default_ttl: int) -> int:
         """
@@ -219,20 +356,51 @@ class ScraperCache:
             return False
 
         cache_file = self.product_cache_dir / f"{roaster_id}.json"
+        self._mem.pop(cache_file, None)
 
         try:
-            # Convert products to serializable format
-            serializable_products = [self._convert_to_serializable(product) for product in products]
+            # Models dump themselves; orjson handles dicts natively and defers the rest to _json_default
+            serializable_products = [p.model_dump(mode="json") if hasattr(p, "model_dump") else p for p in products]
 
             # Write to cache file
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(serializable_products, f, indent=2, ensure_ascii=False)
+            payload = orjson.dumps(serializable_products, default=_json_default, option=_JSON_OPTIONS)
+            self._atomic_write_bytes(cache_file, payload)
+            self._product_mtimes[roaster_id] = time.time_ns()
             return True
 
         except Exception as e:
             logger.warning(f"Error writing products cache for roaster {roaster_id}: {e}")
             return False
 
+    @staticmethod
+    def _remove_file(cache_file: Path) -> int:
+        """Delete a single cache file, returning how many files were removed."""
+        try:
+            os.unlink(cache_file)
+        except FileNotFoundError:
+            return 0
+        return 1
+
+    @classmethod
+    def _remove_files(cls, cache_dir: Path, suffix: str) -> int:
+        """
+        Delete every file with the given suffix in a cache directory and its shard subdirectories,
+        returning how many were removed.
+        """
+        files_removed = 0
+        try:
+            it = os.scandir(cache_dir)
+        except FileNotFoundError:
+            return 0
+        with it:
+            for entry in it:
+                if entry.is_dir():
+                    files_removed += cls._remove_files(Path(entry.path), suffix)
+                elif entry.name.endswith(suffix):
+                    os.unlink(entry.path)
+                    files_removed += 1
+        return files_removed
+
     def clear_cache(
         self, cache_type: Optional[str] = None, roaster_id: Optional[str] = None, url: Optional[str] = None
     ) -> int:
@@ -241,36 +409,36 @@ class ScraperCache:
         if cache_type == "html" or cache_type is None:
             if url:
                 cache_key = self._get_cache_key(url)
-                cache_file = self.page_cache_dir / f"{cache_key}.html"
-                if cache_file.exists():
-                    cache_file.unlink()
-                    files_removed += 1
+                cache_file = self._shard(cache_key, self.page_cache_dir, ".html.zst")
+                self._page_mtimes.pop(cache_key, None)
+                self._mem.pop(cache_file, None)
+                files_removed += self._remove_file(cache_file)
             else:
-                for cache_file in self.page_cache_dir.glob("*.html"):
-                    cache_file.unlink()
-                    files_removed += 1
+                self._forget_dir(self.page_cache_dir)
+                self._page_mtimes.clear()
+                files_removed += self._remove_files(self.page_cache_dir, ".html.zst")
 
         if cache_type == "roaster" or cache_type is None:
             if roaster_id:
-                cache_file = self.roaster_cache_dir / f"{roaster_id}.json"
-                if cache_file.exists():
-                    cache_file.unlink()
-                    files_removed += 1
+                cache_file = self._shard(roaster_id, self.roaster_cache_dir, ".json")
+                self._roaster_mtimes.pop(roaster_id, None)
+                self._mem.pop(cache_file, None)
+                files_removed += self._remove_file(cache_file)
             else:
-                for cache_file in self.roaster_cache_dir.glob("*.json"):
-                    cache_file.unlink()
-                    files_removed += 1
+                self._forget_dir(self.roaster_cache_dir)
+                self._roaster_mtimes.clear()
+                files_removed += self._remove_files(self.roaster_cache_dir, ".json")
 
         if cache_type == "product" or cache_type is None:
             if roaster_id:
                 cache_file = self.product_cache_dir / f"{roaster_id}.json"
-                if cache_file.exists():
-                    cache_file.unlink()
-                    files_removed += 1
+                self._product_mtimes.pop(roaster_id, None)
+                self._mem.pop(cache_file, None)
+                files_removed += self._remove_file(cache_file)
             else:
-                for cache_file in self.product_cache_dir.glob("*.json"):
-                    cache_file.unlink()
-                    files_removed += 1
+                self._forget_dir(self.product_cache_dir)
+                self._product_mtimes.clear()
+                files_removed += self._remove_files(self.product_cache_dir, ".json")
 
         return files_removed
 
@@ -287,6 +455,7 @@ def cache_products(roaster_id, products):
 
 
 def get_cached_products(roaster_id, max_age_days=7):
+    """Read-only: the result is shared with the in-memory cache (see ScraperCache.get_cached_products)."""
     return _cache.get_cached_products(roaster_id, max_age_days)
 
 
@@ -303,6 +472,7 @@ def cache_roaster(roaster):
 
 
 def get_cached_roaster(name, url, max_age_days=30, field_stability=None):
+    """Read-only: the result is shared with the in-memory cache (see ScraperCache.get_cached_roaster)."""
     return _cache.get_cached_roaster(name, url, max_age_days, field_stability)
 
 
@@ -6,18 +6,131 @@ Uses LLM models to enhance both roaster and coffee product data.
 """
 
 import asyncio
-import json
+import hashlib
 import logging
+import os
+import random
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-from openai import OpenAI
+import httpx
+import openai
+import orjson
+from openai import AsyncOpenAI
 
 from config import CACHE_DIR, config
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# LLM client settings
+LLM_TIMEOUT = 30.0  # seconds
+LLM_MAX_CONNECTIONS = 64
+
+# Retries for transient LLM failures, with exponential backoff and jitter
+LLM_MAX_ATTEMPTS = 5
+LLM_MAX_BACKOFF = 30.0  # seconds
+LLM_REQUEST_TIMEOUT = 45.0  # hard cap per attempt, seconds
+RETRYABLE_LLM_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,  # includes APITimeoutError
+    openai.InternalServerError,
+    asyncio.TimeoutError,
+)
+
+# LLM rate limits; requests wait on token buckets instead of sleeping between fixed batches
+LLM_MAX_REQUESTS_PER_MINUTE = 600
+LLM_MAX_TOKENS_PER_MINUTE = 1_000_000
+LLM_MAX_CONCURRENT = 20
+
+# On-disk completion cache; bump the version to invalidate every entry (e.g. after changing
+# response handling), and entries older than the TTL are re-requested
+LLM_CACHE_VERSION = 1
+LLM_CACHE_TTL = 30 * 86_400  # seconds
+
+# Static prompt parts, built once and shared by every request (never mutated)
+ROASTER_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a coffee expert who provides precise, factual information.",
+}
+PRODUCT_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a coffee expert who extracts structured attributes from product descriptions.",
+}
+
+# Attribute extraction instructions sent after each product's context
+PRODUCT_ATTRIBUTES_PROMPT = """
+                Based on the coffee product information provided, extract the following attributes:
+
+                1. roast_level: (exactly one of: light, light-medium, medium, medium-dark, dark, city, city-plus, full-city, french, italian, cinnamon, filter, espresso, omniroast, unknown)
+                2. bean_type: (exactly one of: arabica, robusta, liberica, blend, mixed-arabica, arabica-robusta, unknown)
+                3. processing_method: (exactly one of: washed, natural, honey, pulped-natural, anaerobic, monsooned, wet-hulled, carbonic-maceration, double-fermented, unknown)
+                4. region_name: (geographic origin of the coffee beans as a string)
+                5. flavor_profiles: (array of flavor descriptors like: chocolate, fruity, nutty, caramel, berry, citrus, floral, spicy, etc.)
+                6. brew_methods: (array of brewing methods like: espresso, filter, pour-over, french-press, aeropress, moka-pot, cold-brew, etc.)
+                7. is_single_origin: (boolean - true if explicitly described as single origin, false if blend, null if unclear)
+                8. is_seasonal: (boolean - true if described as seasonal/limited/special release, false if regular, null if unclear)
+                9. tags: (array of descriptive tags or keywords)
+                10. varietals: (array of coffee varietals like: bourbon, typica, gesha, caturra, etc.)
+                11. altitude_meters: (integer - elevation in meters if mentioned)
+                12. acidity: (string - acidity level like: low, medium, high, bright, etc.)
+                13. body: (string - body description like: light, medium, full, heavy, etc.)
+                14. sweetness: (string - sweetness level like: low, medium, high, etc.)
+                15. aroma: (string - aroma description)
+                16. with_milk_suitable: (boolean - true if suitable for milk drinks, null if unclear)
+
+                DO NOT infer or guess any values. If a field is not clearly stated in the text, return null for that field.
+                Return ONLY a valid JSON object with these fields and nothing else.
+                """
+
+
+def _read_llm_cache(cache_file: Path) -> Optional[str]:
+    """Return a cached completion if the entry exists and is within LLM_CACHE_TTL, else None."""
+    try:
+        if time.time() - cache_file.stat().st_mtime > LLM_CACHE_TTL:
+            return None
+        return orjson.loads(cache_file.read_bytes())["content"]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable LLM cache entry {cache_file.name}: {e}")
+        return None
+
+
+def _write_llm_cache(cache_file: Path, content: str) -> None:
+    """Atomically store a completion in the on-disk cache."""
+    try:
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(orjson.dumps({"content": content}))
+        os.replace(tmp, cache_file)
+    except Exception as e:
+        logger.warning(f"Failed to cache LLM response: {e}")
+
+
+class AsyncTokenBucket:
+    """Asyncio token bucket that refills continuously at capacity tokens per period."""
+
+    def __init__(self, capacity: float, period: float = 60.0) -> None:
+        self._capacity = capacity
+        self._rate = capacity / period
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Wait until amount tokens are available, then take them."""
+        amount = min(amount, self._capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                await asyncio.sleep((amount - self._tokens) / self._rate)
+
 
 class EnrichmentService:
     """Service for enriching scraped data using LLMs."""
@@ -32,6 +145,89 @@ class EnrichmentService:
         if not self.enabled:
             logger.warning("DeepSeek enrichment disabled: No API key provided")
 
+        # One client per service so requests share its connection pool
+        self._client: Optional[AsyncOpenAI] = None
+        if self.enabled:
+            self._client = AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                max_retries=0,  # _complete retries with backoff itself
+                timeout=LLM_TIMEOUT,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=LLM_MAX_CONNECTIONS, max_keepalive_connections=LLM_MAX_CONNECTIONS
+                    )
+                ),
+            )
+
+        # Responses on disk keyed by a hash of the full request, reused across runs
+        self._exact_cache_dir = Path(CACHE_DIR) / "llm_cache"
+        self._exact_cache_dir.mkdir(exist_ok=True, parents=True)
+
+        self._rpm_limiter = AsyncTokenBucket(LLM_MAX_REQUESTS_PER_MINUTE)
+        self._tpm_limiter = AsyncTokenBucket(LLM_MAX_TOKENS_PER_MINUTE)
+        self._semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENT)
+
+        # Normalized product context -> in-flight task fetching its attributes, shared by identical
+        # products; entries are dropped when the task finishes (the disk cache covers repeats)
+        self._attribute_tasks: Dict[str, "asyncio.Future[Optional[Dict[str, Any]]]"] = {}
+
+    async def aclose(self) -> None:
+        """Close the underlying API client."""
+        if self._client is not None:
+            await self._client.close()
+
+    async def _complete_text(
+        self, messages: List[Dict[str, str]], max_tokens: int, temperature: float
+    ) -> Optional[str]:
+        """
+        Return the completion text for a request, answering identical requests from the on-disk cache.
+        Only non-empty responses are cached; file I/O runs in a worker thread, off the event loop.
+        """
+        key = hashlib.sha256(
+            orjson.dumps(
+                [LLM_CACHE_VERSION, self.model, messages, temperature, max_tokens], option=orjson.OPT_SORT_KEYS
+            )
+        ).hexdigest()
+        cache_file = self._exact_cache_dir / f"{key}.json"
+        cached = await asyncio.to_thread(_read_llm_cache, cache_file)
+        if cached is not None:
+            return cached
+
+        response = await self._complete(messages, max_tokens=max_tokens, temperature=temperature)
+        content = response.choices[0].message.content
+        if content:
+            await asyncio.to_thread(_write_llm_cache, cache_file, content)
+        return content
+
+    async def _complete(self, messages: List[Dict[str, str]], max_tokens: int, temperature: float) -> Any:
+        """
+        Send a chat completion request once the rate limits and concurrency cap allow it.
+        Transient failures are retried with exponential backoff; the last one is re-raised.
+        """
+        # Rough token estimate: ~4 characters per prompt token plus the completion budget
+        estimated_tokens = sum(len(m["content"]) for m in messages) // 4 + max_tokens
+        for attempt in range(LLM_MAX_ATTEMPTS):
+            await self._rpm_limiter.acquire(1)
+            await self._tpm_limiter.acquire(estimated_tokens)
+            try:
+                async with self._semaphore:
+                    return await asyncio.wait_for(
+                        self._client.chat.completions.create(
+                            model=self.model,
+                            messages=messages,
+                            max_tokens=max_tokens,
+                            temperature=temperature,
+                        ),
+                        timeout=LLM_REQUEST_TIMEOUT,
+                    )
+            except RETRYABLE_LLM_ERRORS as e:
+                if attempt == LLM_MAX_ATTEMPTS - 1:
+                    raise
+                delay = min(2**attempt + random.random() * 0.5, LLM_MAX_BACKOFF)
+                logger.warning(f"LLM request failed ({type(e).__name__}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
     async def enhance_roaster_description(self, roaster_data: Dict[str, Any]) -> Dict[str, Any]:
         """Enhance roaster data using DeepSeek LLM."""
         if not self.enabled or not roaster_data.get("name"):
@@ -53,20 +249,13 @@ class EnrichmentService:
             Return ONLY valid JSON with these fields. If you're uncertain about a field, just set it to null.
             """
 
-            client = OpenAI(api_key=self.api_key, base_url=self.base_url)
-
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a coffee expert who provides precise, factual information."},
-                    {"role": "user", "content": prompt},
-                ],
+            content = await self._complete_text(
+                [ROASTER_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
                 max_tokens=300,
                 temperature=0.3,
             )
 
             # Parse response and update data
-            content = response.choices[0].message.content
             result = self._extract_json_from_response(content) if content is not None else None
             if result:
                 for field in ["description", "founded_year", "address"]:
@@ -81,18 +270,57 @@ class EnrichmentService:
             return roaster_data
 
     def _extract_json_from_response(self, text: str) -> Optional[Dict[str, Any]]:
-        """Extract JSON from LLM response."""
-        try:
-            # Find JSON in the response
-            json_start = text.find("{")
-            json_end = text.rfind("}") + 1
-            if json_start >= 0 and json_end > json_start:
-                json_str = text[json_start:json_end]
-                return json.loads(json_str)
-        except Exception as e:
-            logger.error(f"Error parsing LLM JSON: {e}")
+        """
+        Extract the first JSON object from an LLM response.
+        Braces are matched by depth (ignoring those inside strings), so surrounding prose or
+        markdown containing braces doesn't break extraction.
+        """
+        depth = 0
+        start = -1
+        in_string = False
+        escaped = False
+        for i, ch in enumerate(text):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = depth > 0
+            elif ch == "{":
+                if depth == 0:
+                    start = i
+                depth += 1
+            elif ch == "}" and depth > 0:
+                depth -= 1
+                if depth == 0:
+                    try:
+                        result = orjson.loads(text[start : i + 1])
+                    except orjson.JSONDecodeError:
+                        continue
+                    if isinstance(result, dict):
+                        return result
+        if start >= 0:
+            logger.error("Error parsing LLM JSON: no valid JSON object in response")
         return None
 
+    def _merge_llm_attributes(self, product: Dict[str, Any], attributes: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy LLM-extracted attributes into product, only filling fields that are missing or empty."""
+        for key, value in attributes.items():
+            if value is not None and (key not in product or not product[key]):
+                # Special handling for altitude values to ensure they're integers
+                if key in ["altitude_min", "altitude_max"] and value:
+                    try:
+                        product[key] = int(value)
+                    except (ValueError, TypeError):
+                        pass
+                else:
+                    product[key] = value
+                    product[f"{key}_source"] = "llm"
+        return product
+
     async def enhance_product(self, product: Dict[str, Any], roaster_name: Optional[str] = None) -> Dict[str, Any]:
         """Enhance coffee product attributes using DeepSeek."""
         if not self.enabled or not product.get("name"):
@@ -110,97 +338,49 @@ class EnrichmentService:
             if product.get("source_markdown"):
                 combined_text += f"\nProduct Page Content:\n{product['source_markdown']}"
 
-            prompt = """
-                Based on the coffee product information provided, extract the following attributes:
-
-                1. roast_level: (exactly one of: light, light-medium, medium, medium-dark, dark, city, city-plus, full-city, french, italian, cinnamon, filter, espresso, omniroast, unknown)
-                2. bean_type: (exactly one of: arabica, robusta, liberica, blend, mixed-arabica, arabica-robusta, unknown)
-                3. processing_method: (exactly one of: washed, natural, honey, pulped-natural, anaerobic, monsooned, wet-hulled, carbonic-maceration, double-fermented, unknown)
-                4. region_name: (geographic origin of the coffee beans as a string)
-                5. flavor_profiles: (array of flavor descriptors like: chocolate, fruity, nutty, caramel, berry, citrus, floral, spicy, etc.)
-                6. brew_methods: (array of brewing methods like: espresso, filter, pour-over, french-press, aeropress, moka-pot, cold-brew, etc.)
-                7. is_single_origin: (boolean - true if explicitly described as single origin, false if blend, null if unclear)
-                8. is_seasonal: (boolean - true if described as seasonal/limited/special release, false if regular, null if unclear)
-                9. tags: (array of descriptive tags or keywords)
-                10. varietals: (array of coffee varietals like: bourbon, typica, gesha, caturra, etc.)
-                11. altitude_meters: (integer - elevation in meters if mentioned)
-                12. acidity: (string - acidity level like: low, medium, high, bright, etc.)
-                13. body: (string - body description like: light, medium, full, heavy, etc.)
-                14. sweetness: (string - sweetness level like: low, medium, high, etc.)
-                15. aroma: (string - aroma description)
-                16. with_milk_suitable: (boolean - true if suitable for milk drinks, null if unclear)
-
-                DO NOT infer or guess any values. If a field is not clearly stated in the text, return null for that field.
-                Return ONLY a valid JSON object with these fields and nothing else.
-                """
-
-            client = OpenAI(api_key=self.api_key, base_url=self.base_url)
-
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a coffee expert who extracts structured attributes from product descriptions.",
-                    },
-                    {"role": "user", "content": combined_text + "\n\n" + prompt},
-                ],
-                max_tokens=800,
-                temperature=0.1,
-            )
-
-            ai_response = response.choices[0].message.content
-            if not ai_response:
-                logger.warning(f"Empty response from LLM for product {product.get('name')}")
+            # Products with the same context (ignoring whitespace and case) share one LLM request
+            dedupe_key = " ".join(combined_text.split()).lower()
+            task = self._attribute_tasks.get(dedupe_key)
+            if task is None:
+                task = asyncio.ensure_future(self._request_product_attributes(combined_text))
+                self._attribute_tasks[dedupe_key] = task
+                task.add_done_callback(lambda _: self._attribute_tasks.pop(dedupe_key, None))
+            # Shield so one cancelled caller does not cancel the request for the others sharing it
+            attributes = await asyncio.shield(task)
+
+            if attributes is None:
+                logger.warning(f"No attributes from LLM for product {product.get('name')}")
                 return product
 
-            # Extract JSON from response
-            try:
-                # Find JSON in the response
-                json_start = ai_response.find("{")
-                json_end = ai_response.rfind("}") + 1
-                if json_start >= 0 and json_end > json_start:
-                    json_str = ai_response[json_start:json_end]
-                    attributes = json.loads(json_str)
-
-                    # Update product with extracted attributes (only if not already present)
-                    for key, value in attributes.items():
-                        if value is not None and (key not in product or not product[key]):
-                            # Special handling for altitude values to ensure they're integers
-                            if key in ["altitude_min", "altitude_max"] and value:
-                                try:
-                                    product[key] = int(value)
-                                except (ValueError, TypeError):
-                                    pass
-                            else:
-                                product[key] = value
-                                product[f"{key}_source"] = "llm"
-            except Exception as e:
-                logger.error(f"Error parsing LLM JSON for {product.get('name')}: {e}")
-
-            return product
+            return self._merge_llm_attributes(product, attributes)
 
         except Exception as e:
             logger.error(f"Error enhancing product {product.get('name')} with LLM: {e}")
             return product
 
+    async def _request_product_attributes(self, combined_text: str) -> Optional[Dict[str, Any]]:
+        """Ask the LLM for the attributes of one product context; None if it returns nothing usable."""
+        ai_response = await self._complete_text(
+            [PRODUCT_SYSTEM_MESSAGE, {"role": "user", "content": combined_text + "\n\n" + PRODUCT_ATTRIBUTES_PROMPT}],
+            max_tokens=800,
+            temperature=0.1,
+        )
+
+        if not ai_response:
+            return None
+
+        return self._extract_json_from_response(ai_response)
+
     async def batch_enrich_products(
-        self, products: List[Dict[str, Any]], roaster_name: Optional[str] = None, batch_size: int = 5
+        self, products: List[Dict[str, Any]], roaster_name: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Process products in batches to avoid overwhelming resources."""
-        results = []
-
+        """Enrich products concurrently; pacing comes from the service's rate limiters and concurrency cap."""
         if not self.enabled:
             return products
 
-        for i in range(0, len(products), batch_size):
-            batch = products[i : i + batch_size]
-            batch_results = await asyncio.gather(*[self.enhance_product(product, roaster_name) for product in batch])
-            results.extend(batch_results)
-            logger.info(f"Processed batch {i // batch_size + 1}/{(len(products) + batch_size - 1) // batch_size}")
-            await asyncio.sleep(1)  # Be nice to servers
-
-        return results
+        results = await asyncio.gather(*[self.enhance_product(product, roaster_name) for product in products])
+        logger.info(f"Enriched {len(results)} products")
+        return list(results)
 
     async def save_enrichment_logs(self, data_list: List[Dict[str, Any]], data_type: str) -> None:
         """Save logs of what was enriched for analysis."""
@@ -212,38 +392,35 @@ class EnrichmentService:
 
         log_file = log_dir / f"llm_enriched_{data_type}.json"
 
-        # Track what fields were enriched with LLM
-        enrichment_stats = {"total_items": len(data_list), "enriched_items": 0, "enriched_fields": {}}
-
-        # Track which items had fields enriched
+        # Track what fields were enriched with LLM, and which items had fields enriched
         enriched_items = []
         enriched_fields_dict: Dict[str, int] = {}
-        enrichment_stats = {"total_items": len(data_list), "enriched_items": 0, "enriched_fields": enriched_fields_dict}
+        enriched_item_count = 0
 
         for item in data_list:
-            item_enriched = False
-            enriched_fields: Dict[str, Any] = {}
-
-            for key, value in item.items():
-                if isinstance(key, str) and key.endswith("_source") and value == "llm":
-                    field_name = key.replace("_source", "")
-                    enriched_fields[field_name] = item.get(field_name)
-
-                    # Update stats - now with proper typing
-                    if field_name not in enriched_fields_dict:
-                        enriched_fields_dict[field_name] = 0
-                    enriched_fields_dict[field_name] += 1
-
-                    item_enriched = True
-
-            if item_enriched:
-                enrichment_stats["enriched_items"] += 1  # type: ignore
+            # Cheap value check first; only "llm"-valued keys need the suffix test
+            enriched_fields = {
+                key[:-7]: item.get(key[:-7])
+                for key, value in item.items()
+                if value == "llm" and isinstance(key, str) and key.endswith("_source")
+            }
+            if enriched_fields:
+                for field_name in enriched_fields:
+                    enriched_fields_dict[field_name] = enriched_fields_dict.get(field_name, 0) + 1
+                enriched_item_count += 1
                 enriched_items.append({"id": item.get("id") or item.get("name"), "enriched_fields": enriched_fields})
 
+        enrichment_stats = {
+            "total_items": len(data_list),
+            "enriched_items": enriched_item_count,
+            "enriched_fields": enriched_fields_dict,
+        }
+
         # Save the stats
         try:
-            with open(log_file, "w", encoding="utf-8") as f:
-                json.dump({"stats": enrichment_stats, "items": enriched_items}, f, indent=2)
+            payload = orjson.dumps({"stats": enrichment_stats, "items": enriched_items}, option=orjson.OPT_INDENT_2)
+            # Write off the event loop so in-flight enrichment requests keep progressing
+            await asyncio.to_thread(log_file.write_bytes, payload)
 
             logger.info(f"Saved enrichment logs to {log_file}")
         except Exception as e:
@@ -295,3 +472,5 @@ async def _enrich_coffee_data_async(coffees: List[Union[Dict[str, Any], Any]]) -
     except Exception as e:
         logger.error(f"Error in coffee enrichment: {e}")
         return 0
+    finally:
+        await service.aclose()
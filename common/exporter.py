@@ -1,12 +1,15 @@
 """
 Standardized data export utilities for the Coffee Scraper system.
-Supports CSV and JSON export with configurable options.
+Supports CSV, JSON and JSON Lines (ndjson) export with configurable options.
 """
 
 import csv
 import json
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, Iterable, List, Literal, Optional
+
+import orjson
 
 
 def export_to_csv(
@@ -38,16 +41,32 @@ def export_to_csv(
     else:
         csv_fieldnames = fieldnames
 
+    if extras_action == "raise":
+        allowed = set(fieldnames)
+        for row in data:
+            extras = [k for k in row if k not in allowed]
+            if extras:
+                raise ValueError(f"dict contains fields not in fieldnames: {', '.join(map(repr, extras))}")
+
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, "w", newline="", encoding=encoding) as f:
-        writer = csv.DictWriter(f, fieldnames=csv_fieldnames, extrasaction=extras_action)
-        writer.writeheader()
-        for row in data:
-            if field_mapping:
-                csv_row = {field_mapping.get(k, k): v for k, v in row.items() if k in fieldnames}
-            else:
-                csv_row = {k: v for k, v in row.items() if k in fieldnames}
-            writer.writerow(csv_row)
+        # Rows are written positionally in fieldnames order; no per-row dict is built
+        writer = csv.writer(f)
+        writer.writerow(csv_fieldnames)
+        if len(fieldnames) > 1 and list(data[0]) == list(fieldnames):
+            # Homogeneous records: pull every column in one C-level itemgetter call,
+            # falling back to per-key lookups only for rows missing a field
+            get_values = itemgetter(*fieldnames)
+
+            def row_values(row):
+                try:
+                    return get_values(row)
+                except KeyError:
+                    return [row.get(k, "") for k in fieldnames]
+
+            writer.writerows(map(row_values, data))
+        else:
+            writer.writerows([row.get(k, "") for k in fieldnames] for row in data)
 
 
 def export_to_json(
@@ -65,3 +84,22 @@ def export_to_json(
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, "w", encoding=encoding) as f:
         json.dump(data, f, indent=indent, sort_keys=sort_keys, ensure_ascii=False)
+
+
+def export_to_ndjson(data: Iterable[Dict[str, Any]], output_path: str) -> int:
+    """
+    Export records to a JSON Lines file, one compact JSON object per line.
+    Records are written as they are consumed, so a generator can be exported without building a list.
+    Args:
+        data: Iterable of dictionaries to export.
+        output_path: Path to the output .ndjson/.jsonl file.
+    Returns:
+        Number of records written.
+    """
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with open(output_path, "wb") as f:
+        for row in data:
+            f.write(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE))
+            count += 1
+    return count
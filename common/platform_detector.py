@@ -1,104 +1,186 @@
-import hashlib
+import asyncio
+import re
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 import aiohttp
 from aiohttp import ClientTimeout
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+
+DETECTION_CACHE_MAXSIZE = 10_000
+# Fingerprints sit in <head> or early <body>, so only the start of each page is downloaded
+DETECTION_MAX_BYTES = 128 * 1024
+DETECTION_CHUNK_SIZE = 16 * 1024
+
+# Fingerprint queries, compiled once and evaluated against a single lxml parse per page
+_SHOPIFY_CDN = etree.XPath('//script[contains(@src, "cdn.shopify.com")]')
+_SHOPIFY_ATTR = etree.XPath("//*[@data-shopify]")
+_WOO_BODY = etree.XPath('//body[contains(@class, "woocommerce")]')
+_WOO_LINK = etree.XPath('//link[contains(@href, "woocommerce")]')
+_WOO_CLASS = etree.XPath('//*[contains(@class, "woocommerce")]')
+_MAGENTO_GEN = etree.XPath('//meta[@name="generator"][contains(@content, "Magento")]')
+_MAGENTO_INIT = etree.XPath('//script[@type="text/x-magento-init"]')
+_MAGENTO_MAGE = etree.XPath("//*[@data-mage-init]")
+_WP_GEN = etree.XPath('//meta[@name="generator"][contains(@content, "WordPress")]')
+_WEBFLOW_GEN = etree.XPath('//meta[@name="generator"][contains(@content, "Webflow")]')
+
+# Raw-text fingerprints, found together in a single scan of the page
+_FINGERPRINT_TOKENS = {
+    "Shopify.theme": "shopify_theme",
+    "woocommerce": "woocommerce",
+    "WooCommerce": "woocommerce",
+    "WOOCOMMERCE": "woocommerce",
+    "/pub/static/frontend/": "magento_static",
+    "var require = {": "magento_require",
+    "baseUrl": "require_base_url",
+    "mage-": "magento_mage",
+    "/wp-content/": "wp_content",
+    "/wp-includes/": "wp_includes",
+    "Webflow.require": "webflow_require",
+}
+_FINGERPRINT_SCAN = re.compile("|".join(re.escape(token) for token in _FINGERPRINT_TOKENS))
+
+# lxml refuses to parse a str that starts with an XML declaration naming an encoding (e.g. XHTML pages)
+_XML_DECLARATION = re.compile(r"^\s*<\?xml[^>]*>")
 
 
 class PlatformDetector:
     def __init__(self):
-        self._cache = {}  # Simple in-memory cache
+        self._cache: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()  # url -> (platform, confidence), LRU
+        self._session: Optional[aiohttp.ClientSession] = None  # Shared across detections, created on first use
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300, enable_cleanup_closed=True),
+                timeout=ClientTimeout(total=10),
+            )
+        return self._session
+
+    async def aclose(self):
+        """Close the shared HTTP session, if one was opened."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def detect(self, url):
-        cache_key = self._get_cache_key(url)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._cache.get(url)
+        if cached is not None:
+            self._cache.move_to_end(url)
+            return cached
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=ClientTimeout(total=10)) as resp:
-                    html = await resp.text()
-            soup = BeautifulSoup(html, "html.parser")
-
-            results = [
-                self._detect_shopify(html, soup, url),
-                self._detect_woocommerce(html, soup, url),
-                self._detect_magento(html, soup, url),
-                self._detect_wordpress(html, soup, url),
-                self._detect_webflow(html, soup, url),
-            ]
-            # Pick the platform with the highest confidence
-            platform, confidence = max(results, key=lambda x: x[1])
-            if confidence < 40:
-                platform, confidence = "unknown", confidence
-            self._cache[cache_key] = (platform, confidence)
+            session = await self._get_session()
+            async with session.get(url) as resp:
+                chunks = []
+                total = 0
+                async for chunk in resp.content.iter_chunked(DETECTION_CHUNK_SIZE):
+                    chunks.append(chunk)
+                    total += len(chunk)
+                    if total >= DETECTION_MAX_BYTES:
+                        break
+                html = b"".join(chunks).decode(resp.charset or "utf-8", errors="replace")
+            platform, confidence = self._classify(html, url)
+            self._cache[url] = (platform, confidence)
+            if len(self._cache) > DETECTION_CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
             return platform, confidence
         except Exception as e:
             print(f"[PlatformDetector] Error for {url}: {e}")
             return "unknown", 0
 
-    def _get_cache_key(self, url):
-        return hashlib.sha256(url.encode()).hexdigest()
+    async def detect_many(self, urls: List[str], concurrency: int = 32) -> Dict[str, Tuple[str, int]]:
+        """Detect platforms for many URLs concurrently over the shared session, keyed by URL."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def detect_one(url):
+            async with semaphore:
+                return url, await self.detect(url)
+
+        return dict(await asyncio.gather(*(detect_one(url) for url in urls)))
+
+    def _classify(self, html, url):
+        """Score every platform against one parse of the page and return the best (platform, confidence)."""
+        markup = _XML_DECLARATION.sub("", html, count=1)
+        # lxml cannot parse an empty document; an empty page simply matches nothing
+        if not markup or markup.isspace():
+            return "unknown", 0
+        tree = lxml_html.document_fromstring(markup)
+        hits = {_FINGERPRINT_TOKENS[m.group()] for m in _FINGERPRINT_SCAN.finditer(html)}
+
+        results = [
+            self._detect_shopify(hits, tree, url),
+            self._detect_woocommerce(hits, tree, url),
+            self._detect_magento(hits, tree, url),
+            self._detect_wordpress(hits, tree, url),
+            self._detect_webflow(hits, tree, url),
+        ]
+        # Pick the platform with the highest confidence
+        platform, confidence = max(results, key=lambda x: x[1])
+        if confidence < 40:
+            platform, confidence = "unknown", confidence
+        return platform, confidence
 
-    def _detect_shopify(self, html, soup, url):
+    def _detect_shopify(self, hits, tree, url):
         score = 0
-        if soup.find("script", src=lambda x: x and "cdn.shopify.com" in x):
+        if _SHOPIFY_CDN(tree):
             score += 40
-        if soup.find(attrs={"data-shopify": True}):
+        if _SHOPIFY_ATTR(tree):
             score += 30
         if "/cdn/shop/" in url:
             score += 10
-        if "Shopify.theme" in html:
+        if "shopify_theme" in hits:
             score += 20
         return ("shopify", min(score, 100))
 
-    def _detect_woocommerce(self, html, soup, url):
+    def _detect_woocommerce(self, hits, tree, url):
         score = 0
-        if soup.find("body", class_=lambda c: c and "woocommerce" in c):
+        if _WOO_BODY(tree):
             score += 40
-        if soup.find("link", href=lambda x: x and "woocommerce" in x):
+        if _WOO_LINK(tree):
             score += 20
-        if "woocommerce" in html.lower():
+        if "woocommerce" in hits:
             score += 20
-        if soup.select('.woocommerce, [class*="woocommerce"]'):
+        if _WOO_CLASS(tree):
             score += 20
         return ("woocommerce", min(score, 100))
 
-    def _detect_magento(self, html, soup, url):
+    def _detect_magento(self, hits, tree, url):
         score = 0
         # Classic meta tag
-        if soup.find("meta", attrs={"name": "generator", "content": lambda x: x and "Magento" in x}):
+        if _MAGENTO_GEN(tree):
             score += 60
         # Magento JS/CSS static assets
-        if "/pub/static/frontend/" in html:
+        if "magento_static" in hits:
             score += 30
         # <script type="text/x-magento-init">
-        if soup.find("script", attrs={"type": "text/x-magento-init"}):
+        if _MAGENTO_INIT(tree):
             score += 30
         # data-mage-init attribute
-        if soup.find(attrs={"data-mage-init": True}):
+        if _MAGENTO_MAGE(tree):
             score += 20
         # JS var require with baseUrl containing /pub/static/frontend/
-        if "var require = {" in html and "baseUrl" in html and "/pub/static/frontend/" in html:
+        if {"magento_require", "require_base_url", "magento_static"} <= hits:
             score += 20
         # Fallback: mage- classes or IDs
-        if "mage-" in html:
+        if "magento_mage" in hits:
             score += 10
         return ("magento", min(score, 100))
 
-    def _detect_wordpress(self, html, soup, url):
+    def _detect_wordpress(self, hits, tree, url):
         score = 0
-        wp_meta = soup.find("meta", attrs={"name": "generator", "content": lambda x: x and "WordPress" in x})
-        wp_paths = "/wp-content/" in html or "/wp-includes/" in html
+        wp_meta = _WP_GEN(tree)
+        wp_paths = "wp_content" in hits or "wp_includes" in hits
         if wp_meta:
             score += 40
         if wp_paths:
             score += 30
         return ("wordpress", min(score, 100))
 
-    def _detect_webflow(self, html, soup, url):
+    def _detect_webflow(self, hits, tree, url):
         score = 0
-        if soup.find("meta", attrs={"name": "generator", "content": lambda x: x and "Webflow" in x}):
+        if _WEBFLOW_GEN(tree):
             score += 60
-        if "Webflow.require" in html:
+        if "webflow_require" in hits:
             score += 30
         return ("webflow", min(score, 100))
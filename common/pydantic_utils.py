@@ -6,15 +6,21 @@ Usage:
 
     roaster = dict_to_pydantic_model(data_dict, Roaster)
     coffee = dict_to_pydantic_model(data_dict, Coffee)
+    coffees = dicts_to_pydantic_models(data_dicts, Coffee)  # one validation call for the whole batch
 """
 
+import functools
 import logging
+import os
+import types
 from collections.abc import Mapping
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from enum import IntEnum
 from inspect import isclass
-from typing import Any, Callable, Dict, Optional, Set, Type, TypeVar
+from itertools import repeat
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple, Type, TypeVar, Union, get_args, get_origin
 
-from pydantic import BaseModel, HttpUrl, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from common.utils import (
     clean_description,
@@ -44,150 +50,266 @@ def model_to_dict(
     Returns:
         A dictionary suitable for database operations
     """
-    model_dict = model.model_dump(
+    # mode="json" has pydantic-core emit str for URLs and ISO strings for datetimes directly
+    return model.model_dump(
+        mode="json",
         exclude_none=exclude_none,
         exclude_defaults=exclude_defaults,
         exclude_unset=exclude_unset,
         exclude=exclude or set(),
     )
-    return _process_dict_for_db(model_dict)
-
-
-def _process_dict_for_db(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Process a dictionary to make it suitable for database operations."""
-    result = {}
-    for key, value in data.items():
-        if isinstance(value, HttpUrl):
-            result[key] = str(value)
-        elif isinstance(value, datetime):
-            result[key] = value.isoformat()
-        elif isinstance(value, dict):
-            result[key] = _process_dict_for_db(value)
-        elif isinstance(value, list):
-            result[key] = [
-                _process_dict_for_db(item)
-                if isinstance(item, dict)
-                else str(item)
-                if isinstance(item, HttpUrl)
-                else item.isoformat()
-                if isinstance(item, datetime)
-                else item
-                for item in value
-            ]
-        else:
-            result[key] = value
-    return result
 
 
 T = TypeVar("T", bound=BaseModel)
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _field_names(model_class: Type[BaseModel]) -> FrozenSet[str]:
+    """Field names of a model class, computed once per class."""
+    return frozenset(model_class.model_fields)
+
+
+# Boolean spellings accepted from scraped strings, matched without lowercasing a copy of every value
+_TRUE_STRINGS = frozenset(("true", "True", "TRUE"))
+_FALSE_STRINGS = frozenset(("false", "False", "FALSE"))
+
+
+class CoerceOp(IntEnum):
+    """How _filter_and_coerce_fields treats the value of a model field."""
+
+    SCALAR = 0
+    LIST_OF_MODEL = 1
+    NESTED_MODEL = 2
+
+
+CoercePlan = Dict[str, Tuple[CoerceOp, Optional[Type[BaseModel]]]]
+
+
+def _build_plan(model_class: Type[BaseModel]) -> CoercePlan:
+    """Classify each field of model_class once, so coercion never re-inspects annotations per value."""
+    plan: CoercePlan = {}
+    for name, field in model_class.model_fields.items():
+        annotation = field.annotation
+        # Unwrap Optional[X] / X | None
+        if get_origin(annotation) in (Union, types.UnionType):
+            args = [arg for arg in get_args(annotation) if arg is not type(None)]
+            if len(args) == 1:
+                annotation = args[0]
+        if get_origin(annotation) is list:
+            submodel = (get_args(annotation) or (None,))[0]
+            if isclass(submodel) and issubclass(submodel, BaseModel):
+                plan[name] = (CoerceOp.LIST_OF_MODEL, submodel)
+                continue
+        elif isclass(annotation) and issubclass(annotation, BaseModel):
+            plan[name] = (CoerceOp.NESTED_MODEL, annotation)
+            continue
+        plan[name] = (CoerceOp.SCALAR, None)
+    return plan
+
+
+def _coercion_plan(model_class: Type[BaseModel]) -> CoercePlan:
+    """Return the coercion plan cached on model_class itself (never one inherited from a parent model)."""
+    plan = model_class.__dict__.get("__pydantic_coerce_plan__")
+    if plan is None:
+        plan = _build_plan(model_class)
+        model_class.__pydantic_coerce_plan__ = plan
+    return plan
+
+
+@functools.lru_cache(maxsize=None)
+def _key_dispatch(
+    model_class: Type[BaseModel], field_map_items: FrozenSet[Tuple[str, str]]
+) -> Dict[str, Tuple[str, CoerceOp, Optional[Type[BaseModel]]]]:
+    """
+    Map every input key that lands on a model field to (field name, coerce op, submodel),
+    for one (model, field_map) pair, so each input key costs a single dict lookup.
+    """
+    field_map = dict(field_map_items)
+    fields = _field_names(model_class)
+    plan = _coercion_plan(model_class)
+    dispatch = {}
+    for key in fields | field_map.keys():
+        field_name = field_map.get(key, key)
+        if field_name in fields:
+            dispatch[key] = (field_name, *plan[field_name])
+    return dispatch
+
+
 def _filter_and_coerce_fields(
     data: Dict[str, Any], model_class: Type[BaseModel], field_map: Optional[dict] = None
 ) -> dict:
     """
     Filter and coerce fields in data to match model_class, with optional field name mapping.
     """
-    if field_map is None:
-        field_map = {}
-    model_fields = set(model_class.model_fields.keys())
+    dispatch = _key_dispatch(model_class, frozenset(field_map.items()) if field_map else frozenset())
     result = {}
     for k, v in data.items():
-        # Map field names if needed
-        field_name = field_map.get(k, k)
-        if field_name not in model_fields:
+        # Map field names if needed, skipping keys that don't belong to the model
+        entry = dispatch.get(k)
+        if entry is None:
             continue
-        # Trim whitespace for strings
+        field_name, op, submodel = entry
         if isinstance(v, str):
+            # Trim whitespace, then convert 'true'/'false' strings to bool
             v = v.strip()
-        # Convert 'true'/'false' strings to bool
-        if isinstance(v, str) and v.lower() in ("true", "false"):
-            v = v.lower() == "true"
-        # Convert numbers in string form
-        if isinstance(v, str) and v.replace(".", "", 1).isdigit():
-            if "." in v:
-                try:
-                    v = float(v)
-                except Exception:
-                    pass
-            else:
-                try:
-                    v = int(v)
-                except Exception:
-                    pass
+            if v in _TRUE_STRINGS:
+                v = True
+            elif v in _FALSE_STRINGS:
+                v = False
+        # Numeric strings are left to pydantic-core, which coerces them for int/float fields only
         # Recursively handle nested models/lists
-        if isinstance(v, list):
-            subfield = model_class.model_fields[field_name]
-            annotation = getattr(subfield, "annotation", None)
-            if annotation is not None and hasattr(annotation, "__origin__") and annotation.__origin__ is list:
-                submodel = annotation.__args__[0]
-                if isclass(submodel) and issubclass(submodel, BaseModel):
-                    v = [
-                        _filter_and_coerce_fields(dict(item), submodel) if isinstance(item, Mapping) else item
-                        for item in v
-                    ]
-        elif isinstance(v, dict):
-            subfield = model_class.model_fields[field_name]
-            submodel = getattr(subfield.annotation, "__args__", [None])[0] or subfield.annotation
-            if isclass(submodel) and issubclass(submodel, BaseModel):
-                v = _filter_and_coerce_fields(v, submodel)
+        if op is CoerceOp.LIST_OF_MODEL and isinstance(v, list):
+            # Dict items are passed as-is: _filter_and_coerce_fields only reads its input
+            v = [
+                _filter_and_coerce_fields(item if type(item) is dict else dict(item), submodel)
+                if isinstance(item, Mapping)
+                else item
+                for item in v
+            ]
+        elif op is CoerceOp.NESTED_MODEL and isinstance(v, dict):
+            v = _filter_and_coerce_fields(v, submodel)
         result[field_name] = v
     return result
 
 
+def _construct_trusted(model_class: Type[T], data: Dict[str, Any]) -> T:
+    """Build model_class (and its nested models) with model_construct, skipping validation."""
+    plan = _coercion_plan(model_class)
+    values = {}
+    for field_name, value in data.items():
+        op, submodel = plan.get(field_name, (CoerceOp.SCALAR, None))
+        if op is CoerceOp.LIST_OF_MODEL and isinstance(value, list):
+            value = [_construct_trusted(submodel, item) if isinstance(item, dict) else item for item in value]
+        elif op is CoerceOp.NESTED_MODEL and isinstance(value, dict):
+            value = _construct_trusted(submodel, value)
+        values[field_name] = value
+    return model_class.model_construct(**values)
+
+
 def dict_to_pydantic_model(
     data: Dict[str, Any],
     model_class: Type[T],
     field_map: Optional[dict] = None,
     preprocessor: Optional[Callable[[dict], dict]] = None,
+    trust: bool = False,
 ) -> Optional[T]:
     """
     Convert a dict to a Pydantic model instance, with preprocessing and type coercion.
     - field_map: dict for renaming fields (e.g., {'about_url': 'aboutUrl'})
     - preprocessor: function to further clean data before model instantiation
+    - trust: skip validation with model_construct; only for data already in the model's types
+      (e.g. our own model_to_dict output), since nothing is coerced or checked
     """
     try:
         clean_data = _filter_and_coerce_fields(data, model_class, field_map)
         if preprocessor:
             clean_data = preprocessor(clean_data)
+        if trust:
+            return _construct_trusted(model_class, clean_data)
         return model_class(**clean_data)
     except ValidationError as e:
         logger.error(f"Validation error for {model_class.__name__}: {e}")
         return None
 
 
+@functools.lru_cache(maxsize=None)
+def _list_adapter(model_class: Type[BaseModel]) -> TypeAdapter:
+    """TypeAdapter validating a list of model_class, built once per class."""
+    return TypeAdapter(List[model_class])
+
+
+def dicts_to_pydantic_models(
+    data_list: List[Dict[str, Any]],
+    model_class: Type[T],
+    field_map: Optional[dict] = None,
+    preprocessor: Optional[Callable[[dict], dict]] = None,
+) -> List[Optional[T]]:
+    """
+    Batch form of dict_to_pydantic_model: validate every row in a single pydantic-core call.
+    Returns one entry per input row, None where that row failed validation (each failure is logged).
+    """
+    rows = [_filter_and_coerce_fields(data, model_class, field_map) for data in data_list]
+    if preprocessor:
+        rows = [preprocessor(row) for row in rows]
+    adapter = _list_adapter(model_class)
+    try:
+        return adapter.validate_python(rows)
+    except ValidationError as e:
+        failed: Dict[int, List[dict]] = {}
+        for error in e.errors():
+            failed.setdefault(error["loc"][0], []).append(error)
+    for index, errors in failed.items():
+        logger.error(f"Validation error for {model_class.__name__} at row {index}: {errors}")
+    # Validate the remaining rows in one more batch and put them back in input order
+    valid = iter(adapter.validate_python([row for index, row in enumerate(rows) if index not in failed]))
+    return [None if index in failed else next(valid) for index in range(len(rows))]
+
+
+def dicts_to_pydantic_models_parallel(
+    data_list: List[Dict[str, Any]],
+    model_class: Type[T],
+    field_map: Optional[dict] = None,
+    preprocessor: Optional[Callable[[dict], dict]] = None,
+    workers: Optional[int] = None,
+) -> List[Optional[T]]:
+    """
+    Process-parallel form of dicts_to_pydantic_models for large batches, preserving input order.
+    model_class and preprocessor must be importable module-level objects so they can be pickled.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(1, -(-len(data_list) // workers))
+    chunks = [data_list[i : i + chunk_size] for i in range(0, len(data_list), chunk_size)]
+    if len(chunks) <= 1:
+        return dicts_to_pydantic_models(data_list, model_class, field_map, preprocessor)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(
+            dicts_to_pydantic_models, chunks, repeat(model_class), repeat(field_map), repeat(preprocessor)
+        )
+        return [model for chunk in results for model in chunk]
+
+
 def preprocess_roaster_data(data: dict) -> dict:
     # Normalize phone fields
-    for phone_field in ["contact_phone", "phone", "mobile"]:
-        if phone_field in data and data[phone_field]:
-            data[phone_field] = normalize_phone_number(data[phone_field])
+    for phone_field in ("contact_phone", "phone", "mobile"):
+        phone = data.get(phone_field)
+        if phone:
+            data[phone_field] = normalize_phone_number(phone)
     # Clean description
-    if "description" in data and data["description"]:
-        data["description"] = clean_description(data["description"])
+    description = data.get("description")
+    if description:
+        data["description"] = clean_description(description)
     # Create slug
-    if "name" in data and data["name"]:
-        data["slug"] = slugify(data["name"])
+    name = data.get("name")
+    if name:
+        data["slug"] = slugify(name)
     # Lowercase domain
-    if "domain" in data and data["domain"]:
-        data["domain"] = data["domain"].lower()
+    domain = data.get("domain")
+    if domain:
+        data["domain"] = domain.lower()
     return data
 
 
 def preprocess_coffee_data(data: dict) -> dict:
     # Standardize roast level
-    if "roast_level" in data and data["roast_level"]:
-        data["roast_level"] = standardize_roast_level(data["roast_level"])
+    roast_level = data.get("roast_level")
+    if roast_level:
+        data["roast_level"] = standardize_roast_level(roast_level)
     # Standardize processing method
-    if "processing_method" in data and data["processing_method"]:
-        data["processing_method"] = standardize_processing_method(data["processing_method"])
+    processing_method = data.get("processing_method")
+    if processing_method:
+        data["processing_method"] = standardize_processing_method(processing_method)
     # Standardize bean type
-    if "bean_type" in data and data["bean_type"]:
-        data["bean_type"] = standardize_bean_type(data["bean_type"])
+    bean_type = data.get("bean_type")
+    if bean_type:
+        data["bean_type"] = standardize_bean_type(bean_type)
     # Clean description
-    if "description" in data and data["description"]:
-        data["description"] = clean_description(data["description"])
+    description = data.get("description")
+    if description:
+        data["description"] = clean_description(description)
     # Create slug
-    if "name" in data and data["name"]:
-        data["slug"] = slugify(data["name"])
+    name = data.get("name")
+    if name:
+        data["slug"] = slugify(name)
     return data
+
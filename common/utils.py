@@ -4,10 +4,14 @@ Contains common helpers used across multiple modules.
 """
 
 import asyncio
+import atexit
 import csv
 import re
+from contextlib import nullcontext
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from urllib.parse import urljoin, urlparse
 
 import httpx
@@ -16,18 +20,83 @@ from loguru import logger
 from config import config
 
 
+_SLUG_INVALID_RE = re.compile(r"[^\w\s-]")
+# Any run of whitespace, underscores and hyphens becomes one hyphen, in a single pass
+_SLUG_SEPARATOR_RE = re.compile(r"[\s_-]+")
+# Script/style blocks (with their contents) or any other tag, removed together in one pass
+_HTML_STRIP_RE = re.compile(r"<(script|style)[^>]*>.*?</\1>|<[^>]+>", re.DOTALL)
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+_WWW_PREFIX_RE = re.compile(r"^www\.")
+_FILTER_COFFEE_RE = re.compile(r"filter\s+(coffee|blend)")
+
+
 def slugify(name):
     """Create a URL-friendly slug from a name."""
     if not name:
         return ""
     # Replace special characters
     slug = name.lower()
-    slug = re.sub(r"[^\w\s-]", "", slug)  # Remove non-word chars except spaces and hyphens
-    slug = re.sub(r"[\s_]+", "-", slug)  # Replace whitespace and underscores with hyphens
-    slug = re.sub(r"-+", "-", slug)  # Remove duplicate hyphens
+    slug = _SLUG_INVALID_RE.sub("", slug)  # Remove non-word chars except spaces and hyphens
+    slug = _SLUG_SEPARATOR_RE.sub("-", slug)  # Replace whitespace, underscores and repeated hyphens with one hyphen
     return slug.strip("-")  # Trim hyphens from start and end
 
 
+# Request defaults, read from config once at import; the headers mapping is read-only and shared
+_DEFAULT_TIMEOUT = httpx.Timeout(config.scraper.request_timeout)
+_DEFAULT_HEADERS = MappingProxyType(
+    {
+        "User-Agent": config.scraper.user_agent,
+        "Accept": "text/html,application/xhtml+xml,application/xml",
+        "Accept-Language": "en-US,en;q=0.9",
+    }
+)
+
+_SHARED_CLIENT = None
+_SHARED_CLIENT_LOOP = None
+
+
+def get_shared_client():
+    """Return the process-wide HTTP/2 client, creating it lazily for the running event loop."""
+    global _SHARED_CLIENT, _SHARED_CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    # A client's connection pool is bound to the loop it was first used on (asyncio.run per command)
+    if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed or _SHARED_CLIENT_LOOP is not loop:
+        _SHARED_CLIENT = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=_DEFAULT_TIMEOUT,
+        )
+        _SHARED_CLIENT_LOOP = loop
+    return _SHARED_CLIENT
+
+
+async def aclose_shared_client():
+    """Close the shared client, if one was created."""
+    global _SHARED_CLIENT, _SHARED_CLIENT_LOOP
+    client, _SHARED_CLIENT, _SHARED_CLIENT_LOOP = _SHARED_CLIENT, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+@atexit.register
+def _close_shared_client_at_exit():
+    # Best effort: the owning loop is usually gone by now, so close the pool on a fresh one
+    if _SHARED_CLIENT is not None and not _SHARED_CLIENT.is_closed:
+        try:
+            asyncio.run(aclose_shared_client())
+        except Exception:
+            pass
+
+
+def http_client_context(client=None, **kwargs):
+    """Use a shared httpx client if given (caller owns it), else open a throwaway one closed on exit."""
+    if client is not None:
+        return nullcontext(client)
+    return httpx.AsyncClient(**kwargs)
+
+
 async def fetch_with_retry(
     url, client=None, max_retries=3, headers=None, timeout=None, rate_limit=False, rate_limiter=None, _visited_urls=None
 ):
@@ -50,86 +119,77 @@ async def fetch_with_retry(
 
     # Use default headers if none provided
     if headers is None:
-        headers = {
-            "User-Agent": config.scraper.user_agent,
-            "Accept": "text/html,application/xhtml+xml,application/xml",
-            "Accept-Language": "en-US,en;q=0.9",
-        }
+        headers = _DEFAULT_HEADERS
 
     # Use default timeout if none provided
     if timeout is None:
-        timeout = httpx.Timeout(config.scraper.request_timeout)
+        timeout = _DEFAULT_TIMEOUT
 
-    # If no client provided, create a new one
-    close_client = False
+    # If no client provided, use the shared pooled client (never closed here)
+    request_kwargs = {}
     if client is None:
-        client = httpx.AsyncClient(timeout=timeout, follow_redirects=True)
-        close_client = True
+        client = get_shared_client()
+        request_kwargs["timeout"] = timeout
 
-    # Perform retry logic
+    # Perform retry logic; redirect hops share the same attempt budget and client
     backoff = 1
     last_error = None
+    attempt = 0
 
-    try:
-        for attempt in range(max_retries):
-            try:
-                response = await client.get(url, headers=headers)
-
-                # Check for rate limiting
-                if response.status_code == 429:
-                    wait_time = int(response.headers.get("Retry-After", str(backoff * 5)))
-                    logger.warning(f"Rate limited (429) for {url}. Waiting {wait_time}s")
-                    await asyncio.sleep(wait_time)
-                    continue  # Retry immediately after waiting
-
-                # Return successful responses
-                if response.status_code == 200:
-                    return response
-
-                # Handle redirect
-                if response.status_code in (301, 302, 307, 308):
-                    redirect_url = response.headers.get("Location")
-                    if redirect_url:
-                        logger.info(f"Following redirect: {url} -> {redirect_url}")
-                        return await fetch_with_retry(
-                            urljoin(url, redirect_url),
-                            client=None,  # Create new client for redirect
-                            max_retries=max_retries - 1,
-                            headers=headers,
-                            timeout=timeout,
-                            rate_limit=rate_limit,
-                            rate_limiter=rate_limiter,
-                            _visited_urls=_visited_urls.copy(),  # Pass visited URLs to prevent loops
-                        )
-
-                # Specific handling for common errors
-                if response.status_code == 404:
-                    raise Exception(f"404 Not Found: {url}")
-                elif response.status_code == 403:
-                    raise Exception(f"403 Forbidden: {url}")
-
-                # General error handling
-                raise Exception(f"HTTP error {response.status_code} for {url}")
-
-            except Exception as e:
-                last_error = e
-                if "404 Not Found" in str(e):
-                    logger.warning(f"404 Not Found: {url}. Stopping retries.")
-                    break
-                if attempt == max_retries - 1:
-                    break
-
-                # Exponential backoff with jitter
-                jitter = 0.5 + (asyncio.get_event_loop().time() % 1) / 2  # 0.5-1.5 jitter factor
-                wait_time = backoff * jitter
-                logger.warning(f"Retry {attempt + 1}/{max_retries} for {url}: {e}. Waiting {wait_time:.1f}s")
-                await asyncio.sleep(wait_time)
-                backoff *= 2  # Exponential backoff
+    while attempt < max_retries:
+        attempt += 1
+        try:
+            response = await client.get(url, headers=headers, **request_kwargs)
 
-    finally:
-        # ✅ FIX: Always close client if we created it
-        if close_client and client:
-            await client.aclose()
+            # Check for rate limiting
+            if response.status_code == 429:
+                wait_time = int(response.headers.get("Retry-After", str(backoff * 5)))
+                logger.warning(f"Rate limited (429) for {url}. Waiting {wait_time}s")
+                await asyncio.sleep(wait_time)
+                continue  # Retry immediately after waiting
+
+            # Return successful responses
+            if response.status_code == 200:
+                return response
+
+            # Handle redirect (for clients not created with follow_redirects)
+            if response.status_code in (301, 302, 307, 308):
+                redirect_url = response.headers.get("Location")
+                if redirect_url:
+                    logger.info(f"Following redirect: {url} -> {redirect_url}")
+                    url = urljoin(url, redirect_url)
+                    # Check for redirect loops
+                    if url in _visited_urls:
+                        last_error = Exception(f"Redirect loop detected: {url}")
+                        break
+                    _visited_urls.add(url)
+                    if rate_limit and rate_limiter:
+                        await rate_limiter.wait()
+                    continue
+
+            # Specific handling for common errors
+            if response.status_code == 404:
+                raise Exception(f"404 Not Found: {url}")
+            elif response.status_code == 403:
+                raise Exception(f"403 Forbidden: {url}")
+
+            # General error handling
+            raise Exception(f"HTTP error {response.status_code} for {url}")
+
+        except Exception as e:
+            last_error = e
+            if "404 Not Found" in str(e):
+                logger.warning(f"404 Not Found: {url}. Stopping retries.")
+                break
+            if attempt == max_retries:
+                break
+
+            # Exponential backoff with jitter
+            jitter = 0.5 + (asyncio.get_event_loop().time() % 1) / 2  # 0.5-1.5 jitter factor
+            wait_time = backoff * jitter
+            logger.warning(f"Retry {attempt}/{max_retries} for {url}: {e}. Waiting {wait_time:.1f}s")
+            await asyncio.sleep(wait_time)
+            backoff *= 2  # Exponential backoff
 
     # If we got here, all retries failed
     error_msg = f"Failed to fetch {url} after {max_retries} attempts"
@@ -138,17 +198,30 @@ async def fetch_with_retry(
     raise Exception(error_msg)
 
 
+async def fetch_many(urls, concurrency=64, **kwargs):
+    """Fetch URLs concurrently over the shared client; returns responses or exceptions in input order.
+
+    Extra keyword arguments go to fetch_with_retry. A rate_limiter passed here is shared by all
+    tasks, so throttling still applies across the whole batch.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    client = kwargs.pop("client", None) or get_shared_client()
+
+    async def fetch_one(url):
+        async with semaphore:
+            return await fetch_with_retry(url, client=client, **kwargs)
+
+    return await asyncio.gather(*(fetch_one(url) for url in urls), return_exceptions=True)
+
+
 def clean_html(html_text):
     """Remove HTML tags from text."""
     if not html_text:
         return ""
-    # Remove script and style tags
-    text = re.sub(r"<(script|style)[^>]*>.*?</\1>", " ", str(html_text), flags=re.DOTALL)
-    # Remove all other HTML tags
-    text = re.sub(r"<[^>]+>", " ", text)
+    # Remove script and style blocks and all other HTML tags
+    text = _HTML_STRIP_RE.sub(" ", str(html_text))
     # Remove extra whitespace
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    return " ".join(text.split())
 
 
 def clean_description(text: str) -> str:
@@ -156,15 +229,136 @@ def clean_description(text: str) -> str:
     if not text:
         return ""
     # Remove HTML tags
-    text = re.sub(r"<[^>]+>", " ", text)
+    text = _HTML_TAG_RE.sub(" ", text)
     # Remove excessive whitespace
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WHITESPACE_RE.sub(" ", text).strip()
     # Filter out common JavaScript warnings
     if text.startswith("JavaScript seems to be disabled"):
         return ""
     return text
 
 
+# Terms that mark a product as not coffee when they appear as whole words in its name
+_NON_COFFEE_TERMS = (
+    "grinder",
+    "machine",
+    "mug",
+    "cup",
+    "filter",
+    "chocolate",
+    "tool",
+    "course",
+    "workshop",
+    "kettle",
+    "dripper",
+    "aeropress",
+    "v60",
+    "chemex",
+    "carafe",
+    "equipment",
+    "accessory",
+    "maker",
+    "bootcamp",
+    "skills",
+    "program",
+    "sensory",
+    "barista",
+    "101:",
+    "masterclass",
+    "paper",
+    "bag",
+    "spoon",
+    "french press",
+    "scale",
+    "stagg",
+    "reusable",
+    "class",
+    "throwdown",
+    "event",
+    "course",
+    "gift card",
+    "subscription",
+    "gift",
+    "course",
+    "workshop",
+    "academy",
+    "training",
+    "espresso machine",
+    "day in the life",
+    "coffee maker",
+    "coffee grinder",
+    "coffee cup",
+    "coffee mug",
+    "coffee filter",
+)
+
+# Name/tag keywords that mark a product as coffee
+_COFFEE_KEYWORDS = (
+    "micro climate",
+    "selection",
+    "signature",
+    "grand reserve",
+    "pocket brew",
+    "arabica",
+    "robusta",
+    "single origin",
+    "blend",
+    "specialty",
+    "direct trade",
+    "direct sourced",
+    "freshly roasted",
+    "civet",
+    "moroccan",
+    "liberica",
+    "decaf",
+    "vienna roast",
+    "espresso roast",
+    "attikan",
+    "dark roast",
+    "medium roast",
+    "light roast",
+    "coffee beans",
+    "coffee blend",
+    "filter coffee",
+    "balmaadi wild",
+    "malabar",
+    "peaberry",
+    "julien peak",
+    "salawara reserve",
+    "old kent vienna",
+    "thogarihunkal",
+    "salawara",
+    "ratnagiri",
+    "mandalkhan",
+    "l&#8217;lmore",
+    "turkish",
+    "unakki",
+    "terrazas del pisque sidra",
+)
+
+# Description phrases that mark a product as coffee beans
+_BEAN_INDICATORS = (
+    "medium roast",
+    "light roast",
+    "dark roast",
+    "single origin",
+    "arabica beans",
+    "robusta beans",
+    "fruity notes",
+    "chocolate notes",
+    "caramel notes",
+)
+
+# Product types that settle the question before any keyword scan
+_COFFEE_PRODUCT_TYPES = frozenset(("coffee", "beans", "ground coffee"))
+_BEAN_PRODUCT_TYPES = frozenset(("beans", "coffee", "ground coffee", "whole bean"))
+
+# Each term list is matched in one scan; non-coffee terms must be bounded by spaces or the ends of the name
+_NON_COFFEE_RE = re.compile(r"(?<![^ ])(?:" + "|".join(map(re.escape, _NON_COFFEE_TERMS)) + r")(?![^ ])")
+_COFFEE_KEYWORDS_RE = re.compile("|".join(map(re.escape, _COFFEE_KEYWORDS)))
+_BEAN_INDICATORS_RE = re.compile("|".join(map(re.escape, _BEAN_INDICATORS)))
+
+
 def is_coffee_product(name, description=None, product_type=None, tags=None, roaster_name="Unknown", url=""):
     """Determine if a product is coffee (beans or ground)."""
     if not name:
@@ -175,138 +369,43 @@ def is_coffee_product(name, description=None, product_type=None, tags=None, roas
     product_type = (product_type or "").lower()
 
     # Definitely coffee if product type says so
-    if product_type in ["coffee", "beans", "ground coffee"]:
+    if product_type in _COFFEE_PRODUCT_TYPES:
         logger.debug(f"✅ Accepted: '{name}' | Reason: product_type={product_type}")
         return True
 
     # Skip obvious non-coffee products
-    non_coffee_terms = [
-        "grinder",
-        "machine",
-        "mug",
-        "cup",
-        "filter",
-        "chocolate",
-        "tool",
-        "course",
-        "workshop",
-        "kettle",
-        "dripper",
-        "aeropress",
-        "v60",
-        "chemex",
-        "carafe",
-        "equipment",
-        "accessory",
-        "maker",
-        "bootcamp",
-        "skills",
-        "program",
-        "sensory",
-        "barista",
-        "101:",
-        "masterclass",
-        "paper",
-        "bag",
-        "spoon",
-        "french press",
-        "scale",
-        "stagg",
-        "reusable",
-        "class",
-        "throwdown",
-        "event",
-        "course",
-        "gift card",
-        "subscription",
-        "gift",
-        "course",
-        "workshop",
-        "academy",
-        "training",
-        "espresso machine",
-        "day in the life",
-        "coffee maker",
-        "coffee grinder",
-        "coffee cup",
-        "coffee mug",
-        "coffee filter",
-    ]
-
-    for term in non_coffee_terms:
-        if f" {term} " in f" {name} ":
-            reason = f"excluded term '{term}' in name"
-            logger.debug(f"⛔ Skipping: '{name}' | Reason: {reason}")
-            record_skipped_product(name, reason, roaster_name, url)
-            return False
-
-    if "filter" in name and not re.search(r"filter\s+(coffee|blend)", name):
+    if _NON_COFFEE_RE.search(name):
+        # Report the first listed term that matched, as the per-term loop used to
+        padded_name = f" {name} "
+        term = next(term for term in _NON_COFFEE_TERMS if f" {term} " in padded_name)
+        reason = f"excluded term '{term}' in name"
+        logger.debug(f"⛔ Skipping: '{name}' | Reason: {reason}")
+        record_skipped_product(name, reason, roaster_name, url)
+        return False
+
+    if "filter" in name and not _FILTER_COFFEE_RE.search(name):
         reason = "filter in name but not coffee"
         logger.debug(f"⛔ Skipping: '{name}' | Reason: {reason}")
         record_skipped_product(name, reason, roaster_name, url)
         return False
 
     # These types are definitely coffee
-    bean_types = ["beans", "coffee", "ground coffee", "whole bean"]
-    if product_type in bean_types:
+    if product_type in _BEAN_PRODUCT_TYPES:
         logger.debug(f"✅ Accepted: '{name}' | Reason: product_type={product_type}")
         return True
 
     # Check for coffee keywords
-    coffee_keywords = [
-        "micro climate",
-        "selection",
-        "signature",
-        "grand reserve",
-        "pocket brew",
-        "arabica",
-        "robusta",
-        "single origin",
-        "blend",
-        "specialty",
-        "direct trade",
-        "direct sourced",
-        "freshly roasted",
-        "civet",
-        "moroccan",
-        "liberica",
-        "decaf",
-        "vienna roast",
-        "espresso roast",
-        "attikan",
-        "dark roast",
-        "medium roast",
-        "light roast",
-        "coffee beans",
-        "coffee blend",
-        "filter coffee",
-        "balmaadi wild",
-        "malabar",
-        "peaberry",
-        "julien peak",
-        "salawara reserve",
-        "old kent vienna",
-        "thogarihunkal",
-        "salawara",
-        "ratnagiri",
-        "mandalkhan",
-        "l&#8217;lmore",
-        "turkish",
-        "unakki",
-        "terrazas del pisque sidra",
-    ]
-
-    for kw in coffee_keywords:
-        if kw in name.lower():
-            logger.debug(f"✅ Accepted: '{name}' | Reason: product has bean indicator '{kw}'")
-            return True
+    match = _COFFEE_KEYWORDS_RE.search(name)
+    if match:
+        logger.debug(f"✅ Accepted: '{name}' | Reason: product has bean indicator '{match.group()}'")
+        return True
 
     # 🛡️ Prevent NoneType errors
     if not tags:
         tags = []
 
     # Check for coffee keywords in tags
-    if isinstance(tags, list) and any(kw in tag.lower() for tag in tags for kw in coffee_keywords):
+    if isinstance(tags, list) and any(_COFFEE_KEYWORDS_RE.search(tag.lower()) for tag in tags):
         logger.debug(f"✅ Accepted: '{name}' | Reason: tag includes coffee keyword")
         return True
 
@@ -316,22 +415,9 @@ def is_coffee_product(name, description=None, product_type=None, tags=None, roas
         return True
 
     # Check for beans/roast/origin in description
-    bean_indicators = [
-        "medium roast",
-        "light roast",
-        "dark roast",
-        "single origin",
-        "arabica beans",
-        "robusta beans",
-        "fruity notes",
-        "chocolate notes",
-        "caramel notes",
-    ]
-
-    for indicator in bean_indicators:
-        if indicator in description:
-            logger.debug(f"✅ Accepted: '{name}' | Reason: bean/roast indicator in description")
-            return True
+    if _BEAN_INDICATORS_RE.search(description):
+        logger.debug(f"✅ Accepted: '{name}' | Reason: bean/roast indicator in description")
+        return True
 
     # Default - if unsure whether it's actual coffee beans, skip it
     reason = "doesn't appear to be coffee beans"
@@ -340,8 +426,17 @@ def is_coffee_product(name, description=None, product_type=None, tags=None, roas
     return False
 
 
-def record_skipped_product(name, reason, roaster_name, url=""):
-    """Write skipped product to CSV log."""
+_SKIPPED_FIELDNAMES = ["name", "reason", "roaster", "url", "skipped_at"]
+_SKIPPED_BATCH_SIZE = 256
+_SKIPPED_FLUSH_INTERVAL = 1.0  # seconds
+_skipped_queue = None
+_skipped_queue_loop = None
+# Strong reference to the writer task; the event loop itself only keeps a weak one
+_skipped_writer = None
+
+
+def _write_skipped_rows(rows):
+    """Append skipped-product rows to the CSV log in one open/write."""
     csv_path = Path(config.CACHE_DIR) / "logs" / "skipped_products.csv"
     csv_path.parent.mkdir(exist_ok=True, parents=True)
 
@@ -351,21 +446,76 @@ def record_skipped_product(name, reason, roaster_name, url=""):
         file_exists = csv_path.exists() and csv_path.stat().st_size > 0
 
         with open(csv_path, "a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=["name", "reason", "roaster", "url", "skipped_at"])
+            writer = csv.DictWriter(f, fieldnames=_SKIPPED_FIELDNAMES)
             if not file_exists:
                 writer.writeheader()
-
-            writer.writerow(
-                {
-                    "name": name,
-                    "reason": reason,
-                    "roaster": roaster_name,
-                    "url": url,
-                    "skipped_at": datetime.now().isoformat(),
-                }
-            )
+            writer.writerows(rows)
     except Exception as e:
-        logger.warning(f"Failed to log skipped product {name}: {e}")
+        logger.warning(f"Failed to log {len(rows)} skipped product(s): {e}")
+
+
+def _drain_skipped_queue(queue):
+    """Synchronously write whatever is left in a skipped-product queue."""
+    rows = []
+    while not queue.empty():
+        rows.append(queue.get_nowait())
+    if rows:
+        _write_skipped_rows(rows)
+
+
+async def _skipped_product_writer(queue):
+    """Single writer task: one CSV append per batch of up to _SKIPPED_BATCH_SIZE queued rows."""
+    global _skipped_writer
+    try:
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < _SKIPPED_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            _write_skipped_rows(batch)
+            if len(batch) < _SKIPPED_BATCH_SIZE:
+                # Let a fuller batch accumulate before the next write
+                await asyncio.sleep(_SKIPPED_FLUSH_INTERVAL)
+    finally:
+        # Also runs when the loop shuts down and cancels us, so no queued row is lost
+        _drain_skipped_queue(queue)
+        if _skipped_writer is asyncio.current_task():
+            _skipped_writer = None
+
+
+def _get_skipped_queue(loop):
+    """Return the skipped-product queue for this loop, starting its writer task on first use."""
+    global _skipped_queue, _skipped_queue_loop, _skipped_writer
+    if _skipped_queue is None or _skipped_queue_loop is not loop:
+        if _skipped_queue is not None:
+            _drain_skipped_queue(_skipped_queue)
+        _skipped_queue = asyncio.Queue()
+        _skipped_queue_loop = loop
+        _skipped_writer = loop.create_task(_skipped_product_writer(_skipped_queue))
+    return _skipped_queue
+
+
+@atexit.register
+def _flush_skipped_products_at_exit():
+    if _skipped_queue is not None:
+        _drain_skipped_queue(_skipped_queue)
+
+
+def record_skipped_product(name, reason, roaster_name, url=""):
+    """Write skipped product to CSV log (batched by a background writer inside an event loop)."""
+    row = {
+        "name": name,
+        "reason": reason,
+        "roaster": roaster_name,
+        "url": url,
+        "skipped_at": datetime.now().isoformat(),
+    }
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No running loop (sync caller): write straight through
+        _write_skipped_rows([row])
+        return
+    _get_skipped_queue(loop).put_nowait(row)
 
 
 def normalize_phone_number(phone):
@@ -373,8 +523,8 @@ def normalize_phone_number(phone):
     if not phone:
         return None
 
-    # Remove non-digit characters
-    digits = re.sub(r"\D", "", phone)
+    # Remove non-digit characters (str.isdecimal keeps exactly what \d matches)
+    digits = "".join(filter(str.isdecimal, phone))
 
     # Format Indian phone numbers
     if len(digits) == 10:
@@ -388,6 +538,184 @@ def normalize_phone_number(phone):
     return f"+{digits}"
 
 
+def _compile_terms(mapping):
+    """Compile a mapping's terms into one overlapping scan, ordered so longer terms win at each position."""
+    terms = sorted(mapping, key=len, reverse=True)
+    return re.compile("(?=(" + "|".join(map(re.escape, terms)) + "))"), {term: rank for rank, term in enumerate(terms)}
+
+
+def _longest_term(compiled, text):
+    """Return the longest term contained in text (earliest in the mapping on ties), or None."""
+    pattern, rank = compiled
+    matches = {m.group(1) for m in pattern.finditer(text)}
+    return min(matches, key=rank.__getitem__) if matches else None
+
+
+# Common terms mapped to standard values
+_ROAST_MAPPING = {
+    # Light roasts
+    "light": "light",
+    "light roast": "light",
+    "cinnamon": "cinnamon",
+    "half city": "light",
+    "blonde": "light",
+    "new england": "light",
+    # Light-medium roasts
+    "light medium": "light-medium",
+    "light-medium": "light-medium",
+    "city": "light-medium",  # City is technically light-medium
+    # Medium roasts
+    "medium": "medium",
+    "medium roast": "medium",
+    "city+": "city-plus",
+    "city plus": "city-plus",
+    "full city": "full-city",
+    "american": "medium",
+    "breakfast": "medium",
+    # Medium-dark roasts
+    "medium dark": "medium-dark",
+    "medium-dark": "medium-dark",
+    "full city+": "medium-dark",
+    "full-city+": "medium-dark",
+    "vienna": "medium-dark",
+    "continental": "medium-dark",
+    # Dark roasts
+    "dark": "dark",
+    "dark roast": "dark",
+    "french": "french",
+    "french roast": "french",
+    "italian": "italian",
+    "italian roast": "italian",
+    "espresso": "espresso",
+    "espresso roast": "espresso",
+    "high roast": "dark",
+    "spanish": "dark",
+    # Specialty roasts
+    "omni": "omniroast",
+    "omni roast": "omniroast",
+    "omniroast": "omniroast",
+}
+
+_ROAST_TERMS = _compile_terms(_ROAST_MAPPING)
+
+_PROCESSING_MAPPING = {
+    # Washed process
+    "washed": "washed",
+    "wet": "washed",
+    "wet process": "washed",
+    "fully washed": "washed",
+    "traditional washed": "washed",
+    "water process": "washed",
+    # Natural process
+    "natural": "natural",
+    "dry": "natural",
+    "dry process": "natural",
+    "sun dried": "natural",
+    "sundried": "natural",
+    "unwashed": "natural",
+    "traditional natural": "natural",
+    # Honey process
+    "honey": "honey",
+    "black honey": "honey",
+    "red honey": "honey",
+    "yellow honey": "honey",
+    "white honey": "honey",
+    "golden honey": "honey",
+    "pulped natural": "pulped-natural",
+    "semi-washed": "honey",
+    "semi washed": "honey",
+    # Anaerobic process
+    "anaerobic": "anaerobic",
+    "anaerobic natural": "anaerobic",
+    "anaerobic washed": "anaerobic",
+    "anaerobic fermentation": "anaerobic",
+    "double anaerobic": "anaerobic",
+    "carbonic": "carbonic-maceration",
+    "carbonic maceration": "carbonic-maceration",
+    # Wet hulled
+    "wet hulled": "wet-hulled",
+    "wet-hulled": "wet-hulled",
+    "giling basah": "wet-hulled",
+    # Monsooned
+    "monsooned": "monsooned",
+    "monsoon": "monsooned",
+    "monsooning": "monsooned",
+    "monsooned malabar": "monsooned",
+    # Double fermented
+    "double fermented": "double-fermented",
+    "extended fermentation": "double-fermented",
+    # Experimental (map to unknown)
+    "experimental": "unknown",
+    "experimental process": "unknown",
+}
+
+_PROCESSING_TERMS = _compile_terms(_PROCESSING_MAPPING)
+
+_BEAN_MAPPING = {
+    # Single origin types
+    "arabica": "arabica",
+    "100% arabica": "arabica",
+    "bourbon": "arabica",  # Arabica varietal
+    "typica": "arabica",  # Arabica varietal
+    "gesha": "arabica",  # Arabica varietal
+    "geisha": "arabica",  # Arabica varietal (alternative spelling)
+    "sl-28": "arabica",  # Arabica varietal
+    "sl28": "arabica",  # Arabica varietal
+    "sl-34": "arabica",  # Arabica varietal
+    "sl34": "arabica",  # Arabica varietal
+    "caturra": "arabica",  # Arabica varietal
+    "catuai": "arabica",  # Arabica varietal
+    "catimor": "arabica",  # Arabica varietal
+    "pacamara": "arabica",  # Arabica varietal
+    "maragogipe": "arabica",  # Arabica varietal
+    "pacas": "arabica",  # Arabica varietal
+    "villa sarchi": "arabica",  # Arabica varietal
+    "java": "arabica",  # Arabica varietal
+    "mundo novo": "arabica",  # Arabica varietal
+    "robusta": "robusta",
+    "100% robusta": "robusta",
+    "canephora": "robusta",  # Scientific name for robusta
+    "liberica": "liberica",
+    "100% liberica": "liberica",
+    "excelsa": "liberica",  # Often classified as a type of liberica
+    # Blends
+    "blend": "blend",
+    "coffee blend": "blend",
+    "house blend": "blend",
+    "espresso blend": "blend",
+    "signature blend": "blend",
+    # Specific blend types
+    "arabica blend": "mixed-arabica",
+    "mixed arabica": "mixed-arabica",
+    "arabica mix": "mixed-arabica",
+    "arabica robusta": "arabica-robusta",
+    "arabica robusta blend": "arabica-robusta",
+    "arabica/robusta": "arabica-robusta",
+    "arabica and robusta": "arabica-robusta",
+    "arabica & robusta": "arabica-robusta",
+    "80/20 blend": "arabica-robusta",  # Common ratio for arabica-robusta
+    "80/20": "arabica-robusta",
+}
+
+# Arabica varietal names
+_ARABICA_VARIETALS = (
+    "bourbon",
+    "typica",
+    "gesha",
+    "geisha",
+    "sl-",
+    "sl28",
+    "sl34",
+    "caturra",
+    "catuai",
+    "catimor",
+    "pacamara",
+    "maragogipe",
+    "pacas",
+)
+_ARABICA_VARIETALS_RE = re.compile("|".join(map(re.escape, _ARABICA_VARIETALS)))
+
+
 def standardize_roast_level(roast_text):
     """Convert various roast level texts to standard enum values.
 
@@ -400,59 +728,14 @@ def standardize_roast_level(roast_text):
 
     roast_text = roast_text.lower().strip()
 
-    # Define mapping of common terms to standard values
-    roast_mapping = {
-        # Light roasts
-        "light": "light",
-        "light roast": "light",
-        "cinnamon": "cinnamon",
-        "half city": "light",
-        "blonde": "light",
-        "new england": "light",
-        # Light-medium roasts
-        "light medium": "light-medium",
-        "light-medium": "light-medium",
-        "city": "light-medium",  # City is technically light-medium
-        # Medium roasts
-        "medium": "medium",
-        "medium roast": "medium",
-        "city+": "city-plus",
-        "city plus": "city-plus",
-        "full city": "full-city",
-        "american": "medium",
-        "breakfast": "medium",
-        # Medium-dark roasts
-        "medium dark": "medium-dark",
-        "medium-dark": "medium-dark",
-        "full city+": "medium-dark",
-        "full-city+": "medium-dark",
-        "vienna": "medium-dark",
-        "continental": "medium-dark",
-        # Dark roasts
-        "dark": "dark",
-        "dark roast": "dark",
-        "french": "french",
-        "french roast": "french",
-        "italian": "italian",
-        "italian roast": "italian",
-        "espresso": "espresso",
-        "espresso roast": "espresso",
-        "high roast": "dark",
-        "spanish": "dark",
-        # Specialty roasts
-        "omni": "omniroast",
-        "omni roast": "omniroast",
-        "omniroast": "omniroast",
-    }
-
     # Check for exact matches
-    if roast_text in roast_mapping:
-        return roast_mapping[roast_text]
+    if roast_text in _ROAST_MAPPING:
+        return _ROAST_MAPPING[roast_text]
 
-    # Check for partial matches
-    for term, value in roast_mapping.items():
-        if term in roast_text:
-            return value
+    # Check for partial matches, preferring the most specific (longest) term
+    term = _longest_term(_ROAST_TERMS, roast_text)
+    if term is not None:
+        return _ROAST_MAPPING[term]
 
     # Handle special cases
     if "filter" in roast_text:
@@ -475,66 +758,14 @@ def standardize_processing_method(method_text):
 
     method_text = method_text.lower().strip()
 
-    # Define mapping of common terms to standard values
-    method_mapping = {
-        # Washed process
-        "washed": "washed",
-        "wet": "washed",
-        "wet process": "washed",
-        "fully washed": "washed",
-        "traditional washed": "washed",
-        "water process": "washed",
-        # Natural process
-        "natural": "natural",
-        "dry": "natural",
-        "dry process": "natural",
-        "sun dried": "natural",
-        "sundried": "natural",
-        "unwashed": "natural",
-        "traditional natural": "natural",
-        # Honey process
-        "honey": "honey",
-        "black honey": "honey",
-        "red honey": "honey",
-        "yellow honey": "honey",
-        "white honey": "honey",
-        "golden honey": "honey",
-        "pulped natural": "pulped-natural",
-        "semi-washed": "honey",
-        "semi washed": "honey",
-        # Anaerobic process
-        "anaerobic": "anaerobic",
-        "anaerobic natural": "anaerobic",
-        "anaerobic washed": "anaerobic",
-        "anaerobic fermentation": "anaerobic",
-        "double anaerobic": "anaerobic",
-        "carbonic": "carbonic-maceration",
-        "carbonic maceration": "carbonic-maceration",
-        # Wet hulled
-        "wet hulled": "wet-hulled",
-        "wet-hulled": "wet-hulled",
-        "giling basah": "wet-hulled",
-        # Monsooned
-        "monsooned": "monsooned",
-        "monsoon": "monsooned",
-        "monsooning": "monsooned",
-        "monsooned malabar": "monsooned",
-        # Double fermented
-        "double fermented": "double-fermented",
-        "extended fermentation": "double-fermented",
-        # Experimental (map to unknown)
-        "experimental": "unknown",
-        "experimental process": "unknown",
-    }
-
     # Check for exact matches
-    if method_text in method_mapping:
-        return method_mapping[method_text]
+    if method_text in _PROCESSING_MAPPING:
+        return _PROCESSING_MAPPING[method_text]
 
-    # Check for partial matches
-    for term, value in method_mapping.items():
-        if term in method_text:
-            return value
+    # Check for partial matches, preferring the most specific (longest) term
+    term = _longest_term(_PROCESSING_TERMS, method_text)
+    if term is not None:
+        return _PROCESSING_MAPPING[term]
 
     # Handle special cases with additional fallbacks
     if "double" in method_text and "ferment" in method_text:
@@ -567,56 +798,9 @@ def standardize_bean_type(bean_text):
 
     bean_text = bean_text.lower().strip()
 
-    # Define mapping of common terms to standard values
-    bean_mapping = {
-        # Single origin types
-        "arabica": "arabica",
-        "100% arabica": "arabica",
-        "bourbon": "arabica",  # Arabica varietal
-        "typica": "arabica",  # Arabica varietal
-        "gesha": "arabica",  # Arabica varietal
-        "geisha": "arabica",  # Arabica varietal (alternative spelling)
-        "sl-28": "arabica",  # Arabica varietal
-        "sl28": "arabica",  # Arabica varietal
-        "sl-34": "arabica",  # Arabica varietal
-        "sl34": "arabica",  # Arabica varietal
-        "caturra": "arabica",  # Arabica varietal
-        "catuai": "arabica",  # Arabica varietal
-        "catimor": "arabica",  # Arabica varietal
-        "pacamara": "arabica",  # Arabica varietal
-        "maragogipe": "arabica",  # Arabica varietal
-        "pacas": "arabica",  # Arabica varietal
-        "villa sarchi": "arabica",  # Arabica varietal
-        "java": "arabica",  # Arabica varietal
-        "mundo novo": "arabica",  # Arabica varietal
-        "robusta": "robusta",
-        "100% robusta": "robusta",
-        "canephora": "robusta",  # Scientific name for robusta
-        "liberica": "liberica",
-        "100% liberica": "liberica",
-        "excelsa": "liberica",  # Often classified as a type of liberica
-        # Blends
-        "blend": "blend",
-        "coffee blend": "blend",
-        "house blend": "blend",
-        "espresso blend": "blend",
-        "signature blend": "blend",
-        # Specific blend types
-        "arabica blend": "mixed-arabica",
-        "mixed arabica": "mixed-arabica",
-        "arabica mix": "mixed-arabica",
-        "arabica robusta": "arabica-robusta",
-        "arabica robusta blend": "arabica-robusta",
-        "arabica/robusta": "arabica-robusta",
-        "arabica and robusta": "arabica-robusta",
-        "arabica & robusta": "arabica-robusta",
-        "80/20 blend": "arabica-robusta",  # Common ratio for arabica-robusta
-        "80/20": "arabica-robusta",
-    }
-
     # Check for exact matches
-    if bean_text in bean_mapping:
-        return bean_mapping[bean_text]
+    if bean_text in _BEAN_MAPPING:
+        return _BEAN_MAPPING[bean_text]
 
     # Check for partial matches with context
     if "arabica" in bean_text and "robusta" in bean_text:
@@ -626,22 +810,7 @@ def standardize_bean_type(bean_text):
         return "mixed-arabica"
 
     # Check for varietals - these are all arabica
-    arabica_varietals = [
-        "bourbon",
-        "typica",
-        "gesha",
-        "geisha",
-        "sl-",
-        "sl28",
-        "sl34",
-        "caturra",
-        "catuai",
-        "catimor",
-        "pacamara",
-        "maragogipe",
-        "pacas",
-    ]
-    if any(v in bean_text for v in arabica_varietals):
+    if _ARABICA_VARIETALS_RE.search(bean_text):
         return "arabica"
 
     # Check for excelsa specifically
@@ -666,33 +835,39 @@ def standardize_bean_type(bean_text):
     return "unknown"
 
 
+# Scrapes revisit the same roaster URLs constantly; parse each distinct URL once per process
+_parse_cached = lru_cache(maxsize=8192)(urlparse)
+
+
+@lru_cache(maxsize=8192)
 def get_domain_from_url(url):
     """Extract the domain from a URL."""
     if not url:
         return None
 
-    parsed = urlparse(url)
+    parsed = _parse_cached(url)
     domain = parsed.netloc.lower()
 
     # Remove www prefix
-    domain = re.sub(r"^www\.", "", domain)
+    domain = _WWW_PREFIX_RE.sub("", domain)
 
     return domain
 
 
+@lru_cache(maxsize=8192)
 def normalize_url(url):
     """Normalize URL for caching and comparison purposes."""
     # Parse URL
-    parsed = urlparse(url)
+    parsed = _parse_cached(url)
 
     # Ensure it has a scheme
     if not parsed.scheme:
         url = f"https://{url}"
-        parsed = urlparse(url)
+        parsed = _parse_cached(url)
 
     # Normalize domain (remove www)
     domain = parsed.netloc.lower()
-    domain = re.sub(r"^www\.", "", domain)
+    domain = _WWW_PREFIX_RE.sub("", domain)
 
     # Construct normalized base URL
     base_url = f"{parsed.scheme}://{domain}"
@@ -729,15 +904,13 @@ def extract_instagram_handle(url: str) -> str | None:
 
 def ensure_absolute_url(url: str, base_url: str) -> str:
     """Ensure a URL is absolute."""
-    from urllib.parse import urljoin, urlparse
-
     if not url:
         return ""
 
     if url.startswith(("http://", "https://", "//")):
         return url
     elif url.startswith("/"):
-        parsed_base = urlparse(base_url)
+        parsed_base = _parse_cached(base_url)
         return f"{parsed_base.scheme}://{parsed_base.netloc}{url}"
     else:
         return urljoin(base_url.rstrip("/") + "/", url)
@@ -4,9 +4,26 @@ These models should match the Supabase schema.
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Annotated, Dict, List, Optional
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import AfterValidator, AnyUrl, BaseModel, BeforeValidator, HttpUrl
+from pydantic_core import Url
+
+
+def _url_to_str(value):
+    """Accept already-parsed URL objects (HttpUrl, AnyUrl) by validating their string form."""
+    if isinstance(value, (AnyUrl, Url)):
+        return str(value)
+    return value
+
+
+def _validate_http_url(value: str) -> str:
+    """Validate and normalize an http(s) URL, keeping the result as a plain string."""
+    return str(HttpUrl(value))
+
+
+# Validated like HttpUrl, but stored as str so dumps and DB writes need no Url -> str conversion
+HttpUrlStr = Annotated[str, BeforeValidator(_url_to_str), AfterValidator(_validate_http_url)]
 
 
 class RoastLevel(str):
@@ -102,15 +119,15 @@ class Roaster(BaseDBModel):
 
     name: str
     slug: str
-    website_url: HttpUrl
+    website_url: HttpUrlStr
     description: Optional[str] = None
     address: Optional[str] = None  # Add this new field
     country: str = "India"
     city: Optional[str] = None
     state: Optional[str] = None
     founded_year: Optional[int] = None
-    logo_url: Optional[HttpUrl] = None
-    image_url: Optional[HttpUrl] = None
+    logo_url: Optional[HttpUrlStr] = None
+    image_url: Optional[HttpUrlStr] = None
     contact_email: Optional[str] = None
     contact_phone: Optional[str] = None
     social_links: Optional[List[str]] = None  # Not a SocialLinks object
@@ -137,7 +154,7 @@ class ExternalLink(BaseModel):
     id: Optional[str] = None
     coffee_id: Optional[str] = None
     provider: str
-    url: HttpUrl
+    url: HttpUrlStr
 
 
 class Coffee(BaseDBModel):
@@ -152,8 +169,8 @@ class Coffee(BaseDBModel):
     processing_method: Optional[str] = None  # ProcessingMethod enum
     region_id: Optional[str] = None
     region_name: Optional[str] = None  # For use with upsert_region function
-    image_url: Optional[HttpUrl] = None
-    direct_buy_url: HttpUrl
+    image_url: Optional[HttpUrlStr] = None
+    direct_buy_url: HttpUrlStr
     is_seasonal: Optional[bool] = None
     is_single_origin: Optional[bool] = None
     is_available: bool = True
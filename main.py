@@ -76,7 +76,10 @@ def detect(url):
 
     async def run_detection():
         detector = PlatformDetector()
-        return await detector.detect(url)
+        try:
+            return await detector.detect(url)
+        finally:
+            await detector.aclose()
 
     try:
         platform, confidence = asyncio.run(run_detection())
@@ -276,17 +279,20 @@ def scrape_products(
                             logger.error(f"Failed to scrape products from {item.get('url', 'unknown URL')}: {e}")
                             return []
 
-                # Start all tasks
-                tasks = [scrape_with_semaphore(item) for item in items_to_scrape]  # Updated loop
+                try:
+                    # Start all tasks
+                    tasks = [scrape_with_semaphore(item) for item in items_to_scrape]  # Updated loop
 
-                # Process with progress bar
-                for task in tqdm.tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="Scraping products"):
-                    results = await task
-                    all_results.extend(results)
-                    for coffee in results:  # Assuming results is a list of Coffee objects
-                        supabase.upsert_coffee(coffee)  # supabase expects a Coffee model or dict
+                    # Process with progress bar
+                    for task in tqdm.tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="Scraping products"):
+                        results = await task
+                        all_results.extend(results)
+                        for coffee in results:  # Assuming results is a list of Coffee objects
+                            supabase.upsert_coffee(coffee)  # supabase expects a Coffee model or dict
 
-                return all_results
+                    return all_results
+                finally:
+                    await scraper.aclose()
 
             # Run async scraping in a safe way
             # This logic for running asyncio seems fine, no changes needed here for now.
@@ -309,26 +315,31 @@ def scrape_products(
             logger.info(f"Scraping products from single URL: {url_or_file}")
 
             async def process_single_url():
-                parsed_url_single = urlparse(url_or_file)
-                domain_parts = parsed_url_single.netloc.split(".")
-                # Simplified name derivation
-                roaster_name = domain_parts[-2] if len(domain_parts) >= 2 else parsed_url_single.netloc
-                roaster_id = slugify(roaster_name)  # Simplified ID
-
-                logger.info(f"Preparing to scrape products for {roaster_name} (ID: {roaster_id}) from {url_or_file}")
-                results = await scraper.scrape_products(
-                    roaster_id=roaster_id,
-                    url=url_or_file,
-                    roaster_name=roaster_name,
-                    force_refresh=force,
-                    use_enrichment=enrich,
-                )
-
-                click.echo(f"Successfully scraped {len(results)} coffee products")
-                for coffee in results:  # Assuming results is a list of Coffee objects
-                    supabase.upsert_coffee(coffee)  # supabase expects a Coffee model or dict
-                    click.echo(f"- {coffee.name if hasattr(coffee, 'name') else 'Unknown Product'}")
-                return results
+                try:
+                    parsed_url_single = urlparse(url_or_file)
+                    domain_parts = parsed_url_single.netloc.split(".")
+                    # Simplified name derivation
+                    roaster_name = domain_parts[-2] if len(domain_parts) >= 2 else parsed_url_single.netloc
+                    roaster_id = slugify(roaster_name)  # Simplified ID
+
+                    logger.info(
+                        f"Preparing to scrape products for {roaster_name} (ID: {roaster_id}) from {url_or_file}"
+                    )
+                    results = await scraper.scrape_products(
+                        roaster_id=roaster_id,
+                        url=url_or_file,
+                        roaster_name=roaster_name,
+                        force_refresh=force,
+                        use_enrichment=enrich,
+                    )
+
+                    click.echo(f"Successfully scraped {len(results)} coffee products")
+                    for coffee in results:  # Assuming results is a list of Coffee objects
+                        supabase.upsert_coffee(coffee)  # supabase expects a Coffee model or dict
+                        click.echo(f"- {coffee.name if hasattr(coffee, 'name') else 'Unknown Product'}")
+                    return results
+                finally:
+                    await scraper.aclose()
 
             # Run the async function
             # This logic for running asyncio seems fine.
@@ -577,17 +588,20 @@ def scrape_db_roasters(roaster_id, limit, force, enrich, concurrent, active_only
                         logger.error(f"Failed to scrape products for {roaster.name}: {e}")
                         return []
 
-            # Start all tasks
-            tasks = [scrape_with_semaphore(roaster) for roaster in roasters]
+            try:
+                # Start all tasks
+                tasks = [scrape_with_semaphore(roaster) for roaster in roasters]
 
-            # Process with progress bar
-            for task in tqdm.tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="Scraping roasters"):
-                results = await task
-                all_results.extend(results)
-                for coffee in results:
-                    supabase.upsert_coffee(coffee)
+                # Process with progress bar
+                for task in tqdm.tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="Scraping roasters"):
+                    results = await task
+                    all_results.extend(results)
+                    for coffee in results:
+                        supabase.upsert_coffee(coffee)
 
-            return all_results
+                return all_results
+            finally:
+                await scraper.aclose()
 
         # Run async scraping in a safe way
         if asyncio.get_event_loop().is_running():
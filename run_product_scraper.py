@@ -16,6 +16,9 @@ Usage Examples:
     # Validate existing products
     python run_product_scraper.py validate --input products.json
 
+    # Print products from a roaster link as JSON on stdout (used by the API's subprocess mode)
+    python run_product_scraper.py batch --roaster-link "https://bluetokai.com" --stdout-json
+
     # Test a new roaster with custom settings
     python run_product_scraper.py batch --roaster-link "https://ainmane.com" --output ainmane_products.json --force-refresh --no-enrichment
 
@@ -33,6 +36,7 @@ Available Commands and Arguments:
 BATCH COMMAND (python run_product_scraper.py batch):
     --roasters: JSON file containing roaster data
     --roaster-link: Single roaster URL to scrape
+    --stdout-json: With --roaster-link, print only the products JSON to stdout and skip --output
     --output: Output file (default: ./output/products.json)
     --export-format: Export format: json or csv (default: json)
     --platform: Only scrape specific platform (shopify, woocommerce, static)
@@ -58,10 +62,11 @@ VALIDATE COMMAND (python run_product_scraper.py validate):
 
 import argparse
 import asyncio
+import contextlib
 import json
 import sys
 from pathlib import Path
-from typing import List, Union
+from typing import AsyncIterator, List, Union
 from urllib.parse import urlparse
 
 from loguru import logger
@@ -104,6 +109,9 @@ async def main():
     batch_parser.add_argument("--analyze", action="store_true", help="Generate field coverage analysis report")
     batch_parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     batch_parser.add_argument("--roaster-link", help="Roaster link to scrape")
+    batch_parser.add_argument(
+        "--stdout-json", action="store_true", help="With --roaster-link, print only the products JSON to stdout"
+    )
 
     # Single URL scraper command
     url_parser = subparsers.add_parser("url", help="Scrape a single product URL")
@@ -207,6 +215,8 @@ async def scrape_roasters(args):
                 logger.error(f"Error scraping products for {roaster.get('name', 'Unknown')}: {e}")
                 continue
 
+        await product_scraper.aclose()
+
         # Save results
         output_path = Path(args.output)
         output_path.parent.mkdir(exist_ok=True, parents=True)
@@ -243,6 +253,7 @@ async def scrape_roasters(args):
 
 async def scrape_single_url(args):
     """Scrape a single product URL."""
+    product_scraper = None
     try:
         product_scraper = ProductScraper()
         logger.info(f"Scraping single product: {args.url}")
@@ -284,49 +295,111 @@ async def scrape_single_url(args):
     except Exception as e:
         logger.error(f"Error scraping single product: {e}")
         return 1
+    finally:
+        if product_scraper is not None:
+            await product_scraper.aclose()
 
 
-async def scrape_roaster_link(args):
-    """Scrape roaster information from a link and then scrape products."""
+async def _scrape_link_roaster(roaster_link: str, http_client=None):
+    """Scrape roaster information from a link; raises RuntimeError if the roaster can't be scraped.
+
+    Returns a (roaster, roaster_name) tuple, where roaster_name is derived from the link's domain.
+    """
     from scrapers.roasters_crawl4ai.crawler import RoasterCrawler
 
-    roaster_crawler = RoasterCrawler()
+    roaster_crawler = RoasterCrawler(http_client=http_client)
 
-    try:
-        # Extract name from URL
-        roaster_name = "Unknown Roaster"
-        roaster_url = args.roaster_link
-        
-        parsed_url = urlparse(roaster_url)
-        if parsed_url.netloc:
-            domain_parts = parsed_url.netloc.replace('www.', '').split('.')
-            if domain_parts:
-                roaster_name = domain_parts[0].replace('-', ' ').replace('_', ' ').title()
+    # Extract name from URL
+    roaster_name = "Unknown Roaster"
+    parsed_url = urlparse(roaster_link)
+    if parsed_url.netloc:
+        domain_parts = parsed_url.netloc.replace('www.', '').split('.')
+        if domain_parts:
+            roaster_name = domain_parts[0].replace('-', ' ').replace('_', ' ').title()
 
-        # Extract roaster info (returns Pydantic model)
-        roaster = await roaster_crawler.extract_roaster(roaster_name, roaster_url)
+    # Extract roaster info (returns Pydantic model)
+    roaster = await roaster_crawler.extract_roaster(roaster_name, roaster_link)
 
-        if not roaster:
-            logger.error(f"Failed to scrape roaster from {args.roaster_link}")
-            return 1
+    if not roaster:
+        raise RuntimeError(f"Failed to scrape roaster from {roaster_link}")
 
-        # Initialize product scraper
-        product_scraper = ProductScraper()
+    return roaster, roaster_name
+
+
+async def _scrape_link(
+    roaster_link: str, roaster_id=None, force_refresh: bool = False, use_enrichment: bool = True, http_client=None
+):
+    """Scrape roaster information from a link, then its products.
+
+    Returns a (roaster, products) tuple; raises RuntimeError if the roaster can't be scraped.
+    """
+    roaster, roaster_name = await _scrape_link_roaster(roaster_link, http_client)
+
+    # Initialize product scraper
+    product_scraper = ProductScraper(http_client=http_client)
 
-        # Use direct attribute access on Pydantic roaster model
+    # Use direct attribute access on Pydantic roaster model
+    try:
         products = await product_scraper.scrape_products(
-            roaster_id=roaster.get("roaster_id") or args.roaster_id,
-            url=roaster.get("website_url") or args.roaster_link,
+            roaster_id=roaster.get("roaster_id") or roaster_id,
+            url=roaster.get("website_url") or roaster_link,
             roaster_name=roaster.get("name") or roaster_name,
-            force_refresh=args.force_refresh,
-            use_enrichment=not args.no_enrichment,
+            force_refresh=force_refresh,
+            use_enrichment=use_enrichment,
         )
+    finally:
+        await product_scraper.aclose()
+    return roaster, products
+
+
+async def scrape_batch(
+    roaster_link: str, roaster_id=None, force_refresh: bool = False, use_enrichment: bool = True, http_client=None
+) -> List[dict]:
+    """Scrape all products for a roaster link in-process and return them as JSON-serializable dicts."""
+    _, products = await _scrape_link(roaster_link, roaster_id, force_refresh, use_enrichment, http_client)
+    return [to_json_serializable(product) for product in products]
+
+
+async def iter_products(
+    roaster_link: str, roaster_id=None, force_refresh: bool = False, use_enrichment: bool = True, http_client=None
+) -> AsyncIterator[dict]:
+    """Like scrape_batch, but yield each product as a JSON-serializable dict as soon as it is scraped."""
+    roaster, roaster_name = await _scrape_link_roaster(roaster_link, http_client)
+    product_scraper = ProductScraper(http_client=http_client)
+    try:
+        async for product in product_scraper.iter_products(
+            roaster_id=roaster.get("roaster_id") or roaster_id,
+            url=roaster.get("website_url") or roaster_link,
+            roaster_name=roaster.get("name") or roaster_name,
+            force_refresh=force_refresh,
+            use_enrichment=use_enrichment,
+        ):
+            yield to_json_serializable(product)
+    finally:
+        await product_scraper.aclose()
+
+
+async def scrape_roaster_link(args):
+    """Scrape roaster information from a link and then scrape products."""
+    try:
+        # With --stdout-json, stdout carries only the JSON payload; anything printed while scraping goes to stderr
+        with contextlib.redirect_stdout(sys.stderr) if args.stdout_json else contextlib.nullcontext():
+            roaster, products = await _scrape_link(
+                args.roaster_link,
+                roaster_id=args.roaster_id,
+                force_refresh=args.force_refresh,
+                use_enrichment=not args.no_enrichment,
+            )
+
+        json_data = [to_json_serializable(product) for product in products]
+        if args.stdout_json:
+            json.dump(json_data, sys.stdout, ensure_ascii=False)
+            return 0
 
         # Save products (convert to JSON only when saving)
         output_path = Path(args.output)
         output_path.parent.mkdir(exist_ok=True, parents=True)
 
-        json_data = [to_json_serializable(product) for product in products]
         with open(output_path, "w", encoding="utf-8") as f:
             json.dump(json_data, f, indent=2, ensure_ascii=False)
 
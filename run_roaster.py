@@ -21,6 +21,9 @@ Usage Examples:
     # Test a new roaster
     python run_roaster.py --single --input "Ainmane,https://ainmane.com" --output test_roaster.json
 
+    # Single roaster, JSON result on stdout only (used by the API's subprocess mode)
+    python run_roaster.py --single --input "Ainmane,https://ainmane.com" --stdout-json
+
     # Batch process with custom performance settings
     python run_roaster.py --input roasters.csv --output enriched_roasters.json --limit 5 --concurrency 3 --rate-limit 8 --rate-period 60 --max-retries 3
 
@@ -29,6 +32,7 @@ Available Arguments:
     --output: Output JSON file (default: ./data/output/enriched_roasters.json)
     --limit: Limit number of roasters to scrape
     --single: Process a single roaster (input should be name,url)
+    --stdout-json: With --single, print only the JSON result to stdout and skip --output
     --concurrency: Max concurrent tasks (default: 5)
     --rate-limit: Max requests per rate period (default: 10)
     --rate-period: Rate limiting window in seconds (default: 60.0)
@@ -37,9 +41,12 @@ Available Arguments:
 
 import argparse
 import asyncio
+import contextlib
 import json
 import logging
+import sys
 from pathlib import Path
+from typing import Any, Dict
 
 from common.exporter import export_to_csv
 from scrapers.roasters_crawl4ai.run import process_csv_batch, process_single
@@ -49,6 +56,11 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+async def scrape_single(name: str, url: str, http_client=None) -> Dict[str, Any]:
+    """Scrape a single roaster in-process and return its data as a dict."""
+    return await process_single(name.strip(), url.strip(), http_client=http_client)
+
+
 async def main():
     parser = argparse.ArgumentParser(description="Scrape coffee roaster websites.")
 
@@ -59,6 +71,9 @@ async def main():
 
     # Single roaster mode
     parser.add_argument("--single", action="store_true", help="Process a single roaster (input should be name,url)")
+    parser.add_argument(
+        "--stdout-json", action="store_true", help="With --single, print only the JSON result to stdout"
+    )
 
     # Performance options
     parser.add_argument("--concurrency", type=int, default=5, help="Max concurrent tasks (default: 5)")
@@ -74,8 +89,15 @@ async def main():
         # Process a single roaster
         try:
             name, url = args.input.split(",", 1)
+            if args.stdout_json:
+                # Keep stdout clean for the JSON payload; anything printed while scraping goes to stderr
+                with contextlib.redirect_stdout(sys.stderr):
+                    result = await scrape_single(name, url)
+                json.dump(result, sys.stdout)
+                return
+
             print(f"Processing single roaster: {name} ({url})")
-            result = await process_single(name.strip(), url.strip())
+            result = await scrape_single(name, url)
             print(json.dumps(result, indent=2))
 
             # Save to output file if specified
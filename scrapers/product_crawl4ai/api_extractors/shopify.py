@@ -12,6 +12,7 @@ from common.utils import (
     clean_description,
     ensure_absolute_url,
     extract_brew_methods_from_grind_size,
+    http_client_context,
     is_coffee_product,
     standardize_bean_type,
     standardize_processing_method,
@@ -85,7 +86,10 @@ def extract_processing_method_from_shopify(
 
 
 async def extract_products_shopify(
-    base_url: str, roaster_id: str, product_handle: Optional[str] = None
+    base_url: str,
+    roaster_id: str,
+    product_handle: Optional[str] = None,
+    http_client: Optional[httpx.AsyncClient] = None,
 ) -> List[Dict[str, Any]]:
     """
     Extract coffee products from a Shopify store using the products.json API endpoint.
@@ -94,6 +98,7 @@ async def extract_products_shopify(
         base_url: Base URL of the Shopify store
         roaster_id: Database ID of the roaster
         product_handle: Optional specific product handle to fetch
+        http_client: Optional shared httpx client (a temporary one is used if omitted)
 
     Returns:
         List of Coffee Model instances
@@ -114,7 +119,7 @@ async def extract_products_shopify(
 
     response = None  # Ensure response is always defined
     try:
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+        async with http_client_context(http_client, timeout=30.0, follow_redirects=True) as client:
             response = await client.get(product_api_url)
             response.raise_for_status()  # Raise an exception for bad status codes
             data = response.json()
@@ -11,6 +11,7 @@ from common.utils import (
     clean_description,
     ensure_absolute_url,
     extract_brew_methods_from_grind_size,
+    http_client_context,
     is_coffee_product,
     slugify,
     standardize_bean_type,
@@ -79,7 +80,10 @@ def _extract_attributes_from_tags(tags: List[str]) -> Dict[str, Any]:
 
 
 async def extract_products_woocommerce(
-    base_url: str, roaster_id: str, product_id: Optional[str] = None
+    base_url: str,
+    roaster_id: str,
+    product_id: Optional[str] = None,
+    http_client: Optional[httpx.AsyncClient] = None,
 ) -> List[Dict[str, Any]]:
     """
     Extract coffee products from a WooCommerce store using the WP REST API.
@@ -88,6 +92,7 @@ async def extract_products_woocommerce(
         base_url: Base URL of the WooCommerce store
         roaster_id: Database ID of the roaster
         product_id: Optional specific product ID to fetch
+        http_client: Optional shared httpx client (a temporary one is used if omitted)
 
     Returns:
         List of Coffee Model instances
@@ -114,7 +119,7 @@ async def extract_products_woocommerce(
         logger.info(f"Trying WooCommerce API endpoint: {api_url}")
 
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+            async with http_client_context(http_client, timeout=30.0, follow_redirects=True) as client:
                 response = await client.get(api_url)
 
                 if response.status_code == 200:
@@ -142,7 +147,7 @@ async def extract_products_woocommerce(
         # Try fallback store/products/collection data endpoint
         try:
             api_url = f"{base_url}/wp-json/wc/store/products/collection-data"
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+            async with http_client_context(http_client, timeout=30.0, follow_redirects=True) as client:
                 response = await client.get(api_url)
 
                 if response.status_code == 200:
@@ -160,7 +165,7 @@ async def extract_products_woocommerce(
             if product_id:
                 api_url = f"{base_url}/products/{product_id}.json"
 
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+            async with http_client_context(http_client, timeout=30.0, follow_redirects=True) as client:
                 response = await client.get(api_url)
 
                 if response.status_code == 200:
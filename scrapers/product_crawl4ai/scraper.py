@@ -3,7 +3,7 @@
 # File: scrapers/product_crawl4ai/scraper.py
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from common.cache import cache_products, get_cached_products
 from common.platform_detector import PlatformDetector
@@ -39,8 +39,13 @@ class ProductScraper:
     and product enrichment.
     """
 
-    def __init__(self):
+    def __init__(self, http_client=None):
         self.platform_detector = PlatformDetector()
+        self.http_client = http_client  # optional shared httpx.AsyncClient for the API extractors
+
+    async def aclose(self):
+        """Release the platform detector's HTTP session."""
+        await self.platform_detector.aclose()
 
     async def scrape_products(
         self, roaster_id: str, url: str, roaster_name: str, force_refresh: bool = False, use_enrichment: bool = True
@@ -58,6 +63,19 @@ class ProductScraper:
         Returns:
             List of Coffee model instances that were scraped
         """
+        return [
+            coffee_model
+            async for coffee_model in self.iter_products(roaster_id, url, roaster_name, force_refresh, use_enrichment)
+        ]
+
+    async def iter_products(
+        self, roaster_id: str, url: str, roaster_name: str, force_refresh: bool = False, use_enrichment: bool = True
+    ) -> AsyncIterator[Coffee]:
+        """
+        Scrape products like scrape_products, yielding each Coffee model as soon as it is validated.
+
+        Products are cached only if the iteration runs to completion.
+        """
         logger.info(
             f"Starting product scraping for {roaster_name} ({url}) with force_refresh={force_refresh}, use_enrichment={use_enrichment}"
         )
@@ -65,15 +83,12 @@ class ProductScraper:
             cached_products = get_cached_products(roaster_id, max_age_days=7)
             if cached_products:
                 logger.info(f"Using {len(cached_products)} cached products for {roaster_name}")
-                return [
-                    model
-                    for model in (
-                        dict_to_pydantic_model(p, Coffee, preprocessor=preprocess_coffee_data)
-                        for p in cached_products
-                        if p
-                    )
-                    if model is not None
-                ]
+                for p in cached_products:
+                    if p:
+                        model = dict_to_pydantic_model(p, Coffee, preprocessor=preprocess_coffee_data)
+                        if model is not None:
+                            yield model
+                return
         else:
             logger.info(f"Force refresh enabled for {roaster_name}. Bypassing cache read.")
 
@@ -85,10 +100,10 @@ class ProductScraper:
         products = []
         if platform == "shopify" and confidence >= 70:
             logger.info(f"Using Shopify API extractor for {roaster_name}")
-            products = await extract_products_shopify(url, roaster_id)
+            products = await extract_products_shopify(url, roaster_id, http_client=self.http_client)
         elif platform == "woocommerce" and confidence >= 70:
             logger.info(f"Using WooCommerce API extractor for {roaster_name}")
-            products = await extract_products_woocommerce(url, roaster_id)
+            products = await extract_products_woocommerce(url, roaster_id, http_client=self.http_client)
 
         # 3. Fallback to deep crawling for unknown platforms or if API extraction failed
         if not products:
@@ -148,13 +163,13 @@ class ProductScraper:
                 )
                 if coffee_model:
                     coffee_models.append(coffee_model)
+                    yield coffee_model
 
         # 5. Cache products
         if coffee_models:
             cache_products(roaster_id, [model_to_dict(c) for c in coffee_models])
 
         logger.info(f"Completed scraping for {roaster_name}. Found {len(coffee_models)} coffee products.")
-        return coffee_models
 
     async def scrape_single_product(self, product_url: str, roaster_id: str, roaster_name: str) -> Optional[Coffee]:
         """
@@ -182,7 +197,9 @@ class ProductScraper:
             product_handle = product_url.split("/")[-1]
             if "?" in product_handle:
                 product_handle = product_handle.split("?")[0]
-            products = await extract_products_shopify(base_url, roaster_id, product_handle=product_handle)
+            products = await extract_products_shopify(
+                base_url, roaster_id, product_handle=product_handle, http_client=self.http_client
+            )
             if products:
                 product = products[0]
         elif platform == "woocommerce":
@@ -190,7 +207,9 @@ class ProductScraper:
             product_id = None
             if "product=" in product_url:
                 product_id = product_url.split("product=")[1].split("&")[0]
-            products = await extract_products_woocommerce(base_url, roaster_id, product_id=product_id)
+            products = await extract_products_woocommerce(
+                base_url, roaster_id, product_id=product_id, http_client=self.http_client
+            )
             if products:
                 product = products[0]
 
@@ -14,6 +14,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from loguru import logger
 
 from common.cache import cache
+from common.enricher import EnrichmentService
 from common.exporter import export_to_json
 
 from .crawler import RoasterCrawler
@@ -71,7 +72,9 @@ async def batch_process_roasters(
     Returns:
         List of roaster data dicts.
     """
-    crawler = RoasterCrawler()
+    # One LLM client for the whole batch, created inside the running loop and closed below
+    enrichment_service = EnrichmentService()
+    crawler = RoasterCrawler(enrichment_service=enrichment_service)
     rate_limiter = AsyncRateLimiter(rate_limit, rate_period)
     semaphore = asyncio.Semaphore(concurrency)
     results = []
@@ -87,7 +90,10 @@ async def batch_process_roasters(
             logger.info(f"[{idx + 1}/{total}] Done: {name}")
 
     tasks = [sem_task(i, name, url) for i, (name, url) in enumerate(roaster_list)]
-    await asyncio.gather(*tasks)
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        await enrichment_service.aclose()
 
     # Export results if path provided
     if export_path:
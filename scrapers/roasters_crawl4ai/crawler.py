@@ -32,8 +32,10 @@ from .schemas import ABOUT_SCHEMA, CONTACT_SCHEMA, ROASTER_LLM_INSTRUCTIONS, ROA
 class RoasterCrawler:
     """Extract roaster information using Crawl4AI."""
 
-    def __init__(self):
+    def __init__(self, http_client=None, enrichment_service=None):
         """Initialize the roaster crawler."""
+        self.http_client = http_client  # optional shared httpx.AsyncClient for the fetch fallback
+        self.enrichment_service = enrichment_service  # optional shared EnrichmentService, owned by the caller
         self.cache_dir = Path(app_config.CACHE_DIR) / "crawl4ai"
         self.cache_dir.mkdir(exist_ok=True, parents=True)
         self.page_cache = {}  # Store fetched results per run
@@ -66,7 +68,10 @@ class RoasterCrawler:
 
         # Detect platform using PlatformDetector class (per workflow memory)
         detector = PlatformDetector()
-        platform, confidence = await detector.detect(url)
+        try:
+            platform, confidence = await detector.detect(url)
+        finally:
+            await detector.aclose()
         if platform:
             roaster_data["platform"] = platform
         # Always use get_platform_page_paths for about/contact paths
@@ -131,7 +136,7 @@ class RoasterCrawler:
         print(f"[desc-debug] Final description set in roaster_data: {roaster_data['description']}")
 
         # Enrich missing critical fields (description, founded_year, address)
-        roaster_data = await enrich_missing_fields(roaster_data)
+        roaster_data = await enrich_missing_fields(roaster_data, service=self.enrichment_service)
         # Clean up the data
         cleaned_data = self._cleanup_data(roaster_data)
         return cleaned_data
@@ -163,7 +168,7 @@ class RoasterCrawler:
         except Exception as e:
             # Fallback: use fetch_with_retry to check status
             try:
-                response = await fetch_with_retry(url, max_retries=2)
+                response = await fetch_with_retry(url, client=self.http_client, max_retries=2)
                 return {
                     "active": response.status_code == 200,
                     "final_url": str(response.url),
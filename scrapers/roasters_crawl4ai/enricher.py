@@ -11,8 +11,17 @@ logger = logging.getLogger(__name__)
 CRITICAL_FIELDS = ["description", "founded_year", "address"]
 
 
-async def enrich_missing_fields(roaster_data: Dict[str, Any], extracted_html: Optional[str] = None) -> Dict[str, Any]:
-    """Enrich missing critical fields with LLM."""
+async def enrich_missing_fields(
+    roaster_data: Dict[str, Any],
+    extracted_html: Optional[str] = None,
+    service: Optional[EnrichmentService] = None,
+) -> Dict[str, Any]:
+    """
+    Enrich missing critical fields with LLM.
+
+    Pass ``service`` to reuse one LLM client across roasters; otherwise a
+    service is created for this call and closed before returning.
+    """
     # Check which critical fields are missing
     missing_fields = [field for field in CRITICAL_FIELDS if not roaster_data.get(field)]
 
@@ -25,8 +34,15 @@ async def enrich_missing_fields(roaster_data: Dict[str, Any], extracted_html: Op
         # Only try enrichment if we have the minimum required data
         if roaster_data.get("name"):
             # Call the enrichment service - this now directly updates roaster_data
-            service = EnrichmentService()
-            roaster_data = await service.enhance_roaster_description(roaster_data)
+            if service is not None:
+                roaster_data = await service.enhance_roaster_description(roaster_data)
+            else:
+                # Built here so its client and locks belong to the running event loop
+                owned_service = EnrichmentService()
+                try:
+                    roaster_data = await owned_service.enhance_roaster_description(roaster_data)
+                finally:
+                    await owned_service.aclose()
             logger.info(f"Enriched roaster data: {roaster_data}")
             # Log which fields were enriched
             for field in CRITICAL_FIELDS:
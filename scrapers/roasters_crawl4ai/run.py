@@ -59,9 +59,9 @@ async def process_csv_batch(
     return results, errors
 
 
-async def process_single(name: str, url: str) -> Dict[str, Any]:
+async def process_single(name: str, url: str, http_client=None) -> Dict[str, Any]:
     """Process a single roaster."""
-    crawler = RoasterCrawler()
+    crawler = RoasterCrawler(http_client=http_client)
     return await crawler.extract_roaster(name, url)
 
 
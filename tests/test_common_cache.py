@@ -1,4 +1,5 @@
 import os
+import shutil
 import sys
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -35,3 +36,32 @@ def test_scraper_cache_smoke(tmp_path):
     # Allow empty subdirectories to remain; check all files are deleted
     for root, dirs, files in os.walk(test_cache_dir):
         assert not files  # No files should remain
+
+
+def test_scraper_cache_memory_layer(tmp_path):
+    c = cache.ScraperCache(cache_dir=str(tmp_path / "cache"))
+
+    c.cache_products("roaster1", [{"id": 1, "name": "Coffee"}])
+    first = c.get_cached_products("roaster1")
+    # A repeat read is served from memory: the same shared, read-only object
+    assert c.get_cached_products("roaster1") is first
+
+    # Writing again invalidates the in-memory copy
+    c.cache_products("roaster1", [{"id": 2, "name": "Decaf"}])
+    assert c.get_cached_products("roaster1")[0]["name"] == "Decaf"
+
+    c.clear_cache("product")
+    assert c.get_cached_products("roaster1") is None
+
+
+def test_scraper_cache_survives_deleted_directory(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache.ScraperCache(cache_dir=str(cache_dir))
+    shutil.rmtree(cache_dir)
+
+    # Directories were already created once in this process, so nothing recreates them up front
+    c = cache.ScraperCache(cache_dir=str(cache_dir))
+    assert c.get_cached_products("roaster1") is None
+    assert c.clear_cache() == 0
+    assert c.cache_products("roaster1", [{"id": 1, "name": "Coffee"}])
+    assert c.get_cached_products("roaster1")[0]["name"] == "Coffee"
@@ -1,6 +1,6 @@
 import os
 import sys
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -23,7 +23,6 @@ async def test_enhance_roaster_description_returns_input_if_disabled():
 
 @pytest.mark.asyncio
 async def test_enhance_roaster_description_merges_fields():
-    service = EnrichmentService(api_key="fake-key")
     roaster = {"name": "Test Roaster", "website_url": "https://test.com"}
     fake_response = MagicMock()
     fake_response.choices = [MagicMock()]
@@ -31,13 +30,14 @@ async def test_enhance_roaster_description_merges_fields():
         0
     ].message.content = '{"description": "A great roaster.", "founded_year": 2020, "address": "123 Main St"}'
 
-    with patch.object(
-        service,
-        "_extract_json_from_response",
-        return_value={"description": "A great roaster.", "founded_year": 2020, "address": "123 Main St"},
-    ):
-        with patch("common.enricher.OpenAI") as mock_openai:
-            mock_openai.return_value.chat.completions.create.return_value = fake_response
+    with patch("common.enricher.AsyncOpenAI") as mock_openai:
+        mock_openai.return_value.chat.completions.create = AsyncMock(return_value=fake_response)
+        service = EnrichmentService(api_key="fake-key")
+        with patch.object(
+            service,
+            "_extract_json_from_response",
+            return_value={"description": "A great roaster.", "founded_year": 2020, "address": "123 Main St"},
+        ):
             result = await service.enhance_roaster_description(roaster.copy())
             assert result["description"] == "A great roaster."
             assert result["founded_year"] == 2020
@@ -46,10 +46,10 @@ async def test_enhance_roaster_description_merges_fields():
 
 @pytest.mark.asyncio
 async def test_enhance_roaster_description_handles_exception():
-    service = EnrichmentService(api_key="fake-key")
     roaster = {"name": "Test Roaster"}
-    with patch.object(service, "_extract_json_from_response", side_effect=Exception("fail")):
-        with patch("common.enricher.OpenAI") as mock_openai:
-            mock_openai.return_value.chat.completions.create.side_effect = Exception("fail")
+    with patch("common.enricher.AsyncOpenAI") as mock_openai:
+        mock_openai.return_value.chat.completions.create = AsyncMock(side_effect=Exception("fail"))
+        service = EnrichmentService(api_key="fake-key")
+        with patch.object(service, "_extract_json_from_response", side_effect=Exception("fail")):
             result = await service.enhance_roaster_description(roaster.copy())
             assert result == roaster
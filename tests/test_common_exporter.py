@@ -31,3 +31,32 @@ def test_export_to_csv_and_json(tmp_path):
     with open(json_path, "r", encoding="utf-8") as f:
         loaded = pyjson.load(f)
         assert loaded == data
+
+
+def test_export_to_csv_fills_missing_fields(tmp_path):
+    data = [
+        {"name": "Coffee1", "price": 100, "roast": "light"},
+        {"name": "Coffee2", "roast": "dark"},
+    ]
+    csv_path = tmp_path / "test.csv"
+
+    exporter.export_to_csv(data, str(csv_path))
+    with open(csv_path, "r", encoding="utf-8-sig") as f:
+        lines = f.read().splitlines()
+    assert lines == ["name,price,roast", "Coffee1,100,light", "Coffee2,,dark"]
+
+
+def test_export_to_ndjson_streams_iterable(tmp_path):
+    ndjson_path = tmp_path / "test.ndjson"
+    rows = ({"name": f"Coffee{i}", "price": i * 100} for i in range(3))
+
+    assert exporter.export_to_ndjson(rows, str(ndjson_path)) == 3
+    import json as pyjson
+
+    with open(ndjson_path, "r", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert [pyjson.loads(line) for line in lines] == [
+        {"name": "Coffee0", "price": 0},
+        {"name": "Coffee1", "price": 100},
+        {"name": "Coffee2", "price": 200},
+    ]
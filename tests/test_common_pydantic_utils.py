@@ -66,6 +66,35 @@ def test_dict_to_pydantic_model_field_map():
     assert model.value == 99
 
 
+# Numeric strings are coerced for numeric fields but kept as strings for str fields
+def test_dict_to_pydantic_model_numeric_strings():
+    TestModel = make_test_model()
+    data = {"name": "1890", "value": " 7 "}
+    model = pydantic_utils.dict_to_pydantic_model(data, TestModel)
+    assert model.name == "1890"
+    assert model.value == 7
+
+
+# Test dict_to_pydantic_model with trust=True skips validation
+def test_dict_to_pydantic_model_trusted():
+    TestModel = make_test_model()
+    data = {"name": "Trusted", "value": 5}
+    model = pydantic_utils.dict_to_pydantic_model(data, TestModel, trust=True)
+    assert isinstance(model, TestModel)
+    assert model.name == "Trusted"
+    assert model.value == 5
+    assert model.url == "https://example.com"  # default, never validated into HttpUrl
+
+
+# Test dicts_to_pydantic_models keeps row order and returns None for invalid rows
+def test_dicts_to_pydantic_models_batch():
+    TestModel = make_test_model()
+    data = [{"name": "A", "value": "1"}, {"value": 2}, {"name": "C"}]
+    models = pydantic_utils.dicts_to_pydantic_models(data, TestModel)
+    assert [m.name if m else None for m in models] == ["A", None, "C"]
+    assert models[0].value == 1
+
+
 # Test preprocess_roaster_data and preprocess_coffee_data just run (smoke test)
 def test_preprocess_roaster_data_smoke():
     data = {"name": "Roaster", "website_url": "https://roaster.com"}
@@ -65,3 +65,17 @@ def test_get_domain_from_url(url, expected):
 )
 def test_normalize_url(url, expected):
     assert utils.normalize_url(url) == expected
+
+
+# Partial matches prefer the most specific (longest) term
+@pytest.mark.parametrize(
+    "func,text,expected",
+    [
+        ("standardize_roast_level", "Full City+ roast", "medium-dark"),
+        ("standardize_roast_level", "Medium Dark Roast", "medium-dark"),
+        ("standardize_processing_method", "semi-washed process", "honey"),
+        ("standardize_bean_type", "SL-28 lot", "arabica"),
+    ],
+)
+def test_standardize_prefers_longest_term(func, text, expected):
+    assert getattr(utils, func)(text) == expected
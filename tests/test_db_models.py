@@ -3,7 +3,7 @@ import sys
 from datetime import datetime
 
 import pytest
-from pydantic import ValidationError
+from pydantic import AnyUrl, HttpUrl, ValidationError
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from db import models
@@ -30,6 +30,17 @@ def test_roaster_model_valid():
     assert str(r.website_url) == "https://test.com/"
 
 
+def test_roaster_model_accepts_parsed_urls():
+    r = models.Roaster(
+        name="Test Roaster",
+        slug="test-roaster",
+        website_url=HttpUrl("https://test.com"),
+        logo_url=AnyUrl("https://test.com/logo.png"),
+    )
+    assert r.website_url == "https://test.com/"
+    assert r.logo_url == "https://test.com/logo.png"
+
+
 def test_roaster_model_invalid_url():
     with pytest.raises(ValidationError):
         models.Roaster(name="Test Roaster", slug="test-roaster", website_url="not-a-url")
@@ -33,3 +33,26 @@ async def test_platform_detector_real_sites(url, expected_platform):
 #     platform, confidence = await detector.detect("https://example.com")
 #     assert platform in ("unknown", "static")
 #     assert confidence <= 40
+
+
+def test_platform_detector_classify_offline():
+    detector = PlatformDetector()
+    html = (
+        '<html><head><script src="https://cdn.shopify.com/s/files/theme.js"></script></head>'
+        "<body><script>Shopify.theme = {};</script></body></html>"
+    )
+    assert detector._classify(html, "https://example.com") == ("shopify", 60)
+    assert detector._classify("<html><body><p>plain</p></body></html>", "https://example.com") == ("unknown", 0)
+    assert detector._classify("", "https://example.com") == ("unknown", 0)
+    assert detector._classify(" \n\t", "https://example.com") == ("unknown", 0)
+
+
+def test_platform_detector_classify_xml_declaration():
+    detector = PlatformDetector()
+    html = (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<html xmlns="http://www.w3.org/1999/xhtml"><head>'
+        '<meta name="generator" content="WordPress 6.4" /></head>'
+        '<body class="woocommerce"><link href="/wp-content/plugins/woocommerce/style.css" /></body></html>'
+    )
+    assert detector._classify(html, "https://example.com")[0] == "woocommerce"
@@ -1,6 +1,6 @@
 import os
 import sys
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -41,6 +41,24 @@ async def test_extract_products_shopify_success(mock_client):
     assert products[0]["name"] == "Test Coffee"
 
 
+@pytest.mark.asyncio
+@patch("scrapers.product_crawl4ai.api_extractors.shopify.httpx.AsyncClient")
+async def test_extract_products_shopify_uses_shared_client(mock_client):
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"products": []}
+    shared_client = AsyncMock()
+    shared_client.get.return_value = mock_response
+
+    products = await shopify.extract_products_shopify(
+        "https://test.myshopify.com", "roaster123", http_client=shared_client
+    )
+    assert products == []
+    shared_client.get.assert_awaited_once()
+    mock_client.assert_not_called()
+    shared_client.aclose.assert_not_called()
+
+
 # --- WooCommerce Extractor Tests ---
 @pytest.mark.asyncio
 @patch("scrapers.product_crawl4ai.api_extractors.woocommerce.httpx.AsyncClient")
@@ -333,7 +333,7 @@ async def test_shopify_platform_uses_shopify_extractor(
         SAMPLE_ROASTER_ID, SAMPLE_URL, SAMPLE_ROASTER_NAME, force_refresh=False, use_enrichment=True
     )
 
-    mock_extract_shopify.assert_called_once_with(SAMPLE_URL, SAMPLE_ROASTER_ID)
+    mock_extract_shopify.assert_called_once_with(SAMPLE_URL, SAMPLE_ROASTER_ID, http_client=None)
     mock_discover_crawl4ai.assert_not_called()
     mock_enrich.assert_called_once_with(RAW_PRODUCT_1, SAMPLE_ROASTER_NAME)
 
@@ -362,7 +362,7 @@ async def test_woocommerce_platform_uses_woocommerce_extractor(
         SAMPLE_ROASTER_ID, SAMPLE_URL, SAMPLE_ROASTER_NAME, force_refresh=False, use_enrichment=True
     )
 
-    mock_extract_woocommerce.assert_called_once_with(SAMPLE_URL, SAMPLE_ROASTER_ID)
+    mock_extract_woocommerce.assert_called_once_with(SAMPLE_URL, SAMPLE_ROASTER_ID, http_client=None)
     mock_discover_crawl4ai.assert_not_called()
     mock_enrich.assert_called_once_with(RAW_PRODUCT_1, SAMPLE_ROASTER_NAME)
 
@@ -485,7 +485,7 @@ async def test_shopify_low_confidence_falls_back_to_crawl4ai(
 
     await scraper_instance.scrape_products(SAMPLE_ROASTER_ID, SAMPLE_URL, SAMPLE_ROASTER_NAME)
 
-    mock_extract_shopify.assert_called_once_with(SAMPLE_URL, SAMPLE_ROASTER_ID)  # It's still attempted
+    mock_extract_shopify.assert_called_once_with(SAMPLE_URL, SAMPLE_ROASTER_ID, http_client=None)  # It's still attempted
     mock_discover_crawl4ai.assert_called_once_with(SAMPLE_URL, SAMPLE_ROASTER_ID, SAMPLE_ROASTER_NAME)
     mock_enrich.assert_called_once_with(RAW_PRODUCT_1, SAMPLE_ROASTER_NAME)
     mock_cache_products.assert_called_once()